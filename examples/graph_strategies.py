@@ -2,7 +2,8 @@
 Problem-specific priority functions for graph pathfinding with negative cycles.
 
 These strategies extend the framework's generic priority functions with 
-protection against negative cycles by monitoring path length.
+protection against negative cycles by walking the predecessor chain of each
+newly generated node (Bellman-Ford subtree check).
 
 Design Note:
     These are PROBLEM-SPECIFIC implementations and belong in /examples/, 
@@ -16,12 +17,48 @@ class NegativeCycleDetectedError(Exception):
     """
     Exception raised when a negative cycle is detected in the graph.
     
-    A negative cycle exists if the search explores a path longer than
-    the number of nodes in the graph, indicating a cycle that reduces cost.
+    A negative cycle exists if a newly generated node's state already appears
+    among its own ancestors: with allow_revisit=True a state is only re-pushed
+    when its cost strictly improves, so returning to it means the cycle
+    in between has negative total cost.
     """
     pass
 
 
+def _check_negative_cycle(node: Node[StateType], max_nodes: int) -> None:
+    """
+    Walk the predecessor chain of node and raise if its state reappears.
+    
+    Every ancestor was checked when it was generated, so the only cycle the
+    new node can close is one through its own state. The walk is capped at
+    max_nodes steps: a simple path can never be longer than that.
+    
+    Args:
+        node: The newly generated node
+        max_nodes: Maximum number of nodes in the graph
+        
+    Raises:
+        NegativeCycleDetectedError: If node.state is found among its ancestors
+    """
+    # Unreachable states can't improve anything, skip the walk
+    if node.path_cost == float('inf'):
+        return
+    
+    state = node.state
+    current = node.parent
+    steps = 0
+    
+    while current is not None and steps < max_nodes:
+        if current.state == state:
+            raise NegativeCycleDetectedError(
+                f"Negative cycle detected: state {state!r} reappears in its own "
+                f"predecessor chain after {steps + 1} steps. This indicates a "
+                f"cycle with negative total cost that would cause infinite looping."
+            )
+        current = current.parent
+        steps += 1
+
+
 def robust_uniform_cost_priority(
     node: Node[StateType], 
     heuristic: AbstractHeuristic[StateType],
@@ -34,9 +71,10 @@ def robust_uniform_cost_priority(
     function that adds protection against negative cycles in graphs.
     
     Strategy:
-        If the path length (depth) exceeds the number of nodes in the graph,
-        a cycle must exist. For graphs with negative edges, this could be
-        a negative cycle that would cause infinite looping.
+        Walk the parent chain of the node as soon as it is generated. If its
+        state appears among its ancestors the path has looped back on itself
+        with a lower cost, i.e. through a negative cycle. Detection costs
+        O(n) per node instead of waiting for paths to grow past n nodes.
     
     Args:
         node: The node to compute priority for
@@ -47,8 +85,8 @@ def robust_uniform_cost_priority(
         The path cost g(n) as priority
         
     Raises:
-        NegativeCycleDetectedError: If path length exceeds number of nodes,
-            indicating a potential negative cycle
+        NegativeCycleDetectedError: If the node's state reappears in its
+            predecessor chain, indicating a negative cycle
     
     Example:
         >>> from examples.graph_strategies import robust_uniform_cost_priority
@@ -64,15 +102,8 @@ def robust_uniform_cost_priority(
         ...     heuristic=None
         ... )
     """
-    # Check for negative cycle by path length
-    path_length = node.depth + 1  # depth is 0-indexed, add 1 for actual length
-    
-    if path_length > max_nodes:
-        raise NegativeCycleDetectedError(
-            f"Negative cycle detected: path length ({path_length}) exceeds "
-            f"number of nodes ({max_nodes}). This indicates a cycle with "
-            f"negative total cost that would cause infinite looping."
-        )
+    # Check for negative cycle along the predecessor chain
+    _check_negative_cycle(node, max_nodes)
     
     # Standard UCS priority: g(n)
     return node.path_cost
@@ -90,9 +121,10 @@ def robust_astar_priority(
     function that adds protection against negative cycles in graphs.
     
     Strategy:
-        If the path length (depth) exceeds the number of nodes in the graph,
-        a cycle must exist. For graphs with negative edges, this could be
-        a negative cycle that would cause infinite looping.
+        Walk the parent chain of the node as soon as it is generated. If its
+        state appears among its ancestors the path has looped back on itself
+        with a lower cost, i.e. through a negative cycle. Detection costs
+        O(n) per node instead of waiting for paths to grow past n nodes.
     
     Note:
         A* with admissible heuristics is NOT guaranteed to be optimal in
@@ -109,8 +141,8 @@ def robust_astar_priority(
         The f(n) = g(n) + h(n) value as priority
         
     Raises:
-        NegativeCycleDetectedError: If path length exceeds number of nodes,
-            indicating a potential negative cycle
+        NegativeCycleDetectedError: If the node's state reappears in its
+            predecessor chain, indicating a negative cycle
     
     Example:
         >>> from examples.graph_strategies import robust_astar_priority
@@ -126,15 +158,8 @@ def robust_astar_priority(
         ...     heuristic=my_heuristic
         ... )
     """
-    # Check for negative cycle by path length
-    path_length = node.depth + 1  # depth is 0-indexed, add 1 for actual length
-    
-    if path_length > max_nodes:
-        raise NegativeCycleDetectedError(
-            f"Negative cycle detected: path length ({path_length}) exceeds "
-            f"number of nodes ({max_nodes}). This indicates a cycle with "
-            f"negative total cost that would cause infinite looping."
-        )
+    # Check for negative cycle along the predecessor chain
+    _check_negative_cycle(node, max_nodes)
     
     # Standard A* priority: f(n) = g(n) + h(n)
     g_n = node.path_cost
@@ -143,6 +168,11 @@ def robust_astar_priority(
     return f_n
 
 
+# With a NullHeuristic f(n) = g(n): SearchEngine then calls the UCS variant
+# (also through functools.partial) and skips the h(n) call
+robust_astar_priority.null_heuristic_variant = robust_uniform_cost_priority  # type: ignore[attr-defined]
+
+
 def create_robust_priority_function(base_priority_fn, max_nodes: int):
     """
     Factory function to create a robust priority function from any base function.
@@ -174,16 +204,22 @@ def create_robust_priority_function(base_priority_fn, max_nodes: int):
         ... )
     """
     def wrapped_priority_fn(node: Node[StateType], heuristic: AbstractHeuristic[StateType]) -> float:
-        # Check for negative cycle
-        path_length = node.depth + 1
-        
-        if path_length > max_nodes:
-            raise NegativeCycleDetectedError(
-                f"Negative cycle detected: path length ({path_length}) exceeds "
-                f"number of nodes ({max_nodes})."
-            )
+        # Check for negative cycle along the predecessor chain
+        _check_negative_cycle(node, max_nodes)
         
         # Call the base priority function
         return base_priority_fn(node, heuristic)
     
+    # Carry over the base function's NullHeuristic short-circuit, see
+    # SearchEngine: the wrapped variant skips h(n) the same way. Like the
+    # engine, only trust a marker set on the function itself: a
+    # functools.wraps wrapper inherits its wrapped function's copy.
+    base_variant = None
+    if not hasattr(base_priority_fn, '__wrapped__'):
+        base_variant = getattr(base_priority_fn, '__dict__', {}).get('null_heuristic_variant')
+    if base_variant is not None:
+        wrapped_priority_fn.null_heuristic_variant = create_robust_priority_function(  # type: ignore[attr-defined]
+            base_variant, max_nodes
+        )
+    
     return wrapped_priority_fn
\ No newline at end of file
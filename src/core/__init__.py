@@ -9,9 +9,11 @@ from .types import (
     AbstractHeuristic,
     AbstractFrontier,
     NullHeuristic,
+    MemoizedHeuristic,
     SearchResult,
     StateType
 )
+from .interning import StateInterner
 from .search_engine import SearchEngine
 
 __all__ = [
@@ -21,8 +23,10 @@ __all__ = [
     'AbstractHeuristic',
     'AbstractFrontier',
     'NullHeuristic',
+    'MemoizedHeuristic',
     'SearchResult',
     'StateType',
+    'StateInterner',
     'SearchEngine'
 ]
 
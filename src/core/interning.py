@@ -0,0 +1,160 @@
+"""
+State interning for problems with expensive-to-hash states.
+
+Tuple states (grid coordinates, puzzle boards) are re-hashed and compared
+element by element on every closed-set, best-cost and frontier lookup.
+Interning maps each distinct state to a small integer id the first time it
+is generated, so the search itself only hashes and compares ints.
+"""
+
+from typing import Any, Dict, Generic, List, Sequence, Tuple
+from .types import AbstractProblem, AbstractHeuristic, StateType
+
+
+class StateInterner(Generic[StateType]):
+    """
+    Bidirectional mapping between states and dense integer ids.
+    
+    Ids are assigned in order of first sight, starting at 0, and stay valid
+    for the interner's lifetime (nodes left in a frontier refer to them).
+    
+    Attributes:
+        to_id: Dict mapping states to their id
+        states: List mapping ids back to their state
+    """
+    
+    def __init__(self):
+        """Initialize an empty interner."""
+        self.to_id: Dict[StateType, int] = {}
+        self.states: List[StateType] = []
+    
+    def intern(self, state: StateType) -> int:
+        """
+        Return the id of a state, assigning the next free id if it is new.
+        
+        Args:
+            state: The state to intern
+        
+        Returns:
+            The integer id of the state
+        """
+        state_id = self.to_id.get(state)
+        if state_id is None:
+            state_id = self.to_id[state] = len(self.states)
+            self.states.append(state)
+        return state_id
+    
+    def __len__(self) -> int:
+        """
+        Return the number of interned states.
+        
+        Returns:
+            Count of distinct states seen so far
+        """
+        return len(self.states)
+
+
+class InternedProblem(AbstractProblem[int]):
+    """
+    View of a problem whose states are replaced by their interned ids.
+    
+    Successor states are interned as they are generated; is_goal() and the
+    optional min_remaining_cost() look the real state up by id.
+    
+    Attributes:
+        problem: The wrapped problem
+        interner: The StateInterner mapping states to ids
+    """
+    
+    def __init__(self, problem: AbstractProblem[StateType],
+                 interner: StateInterner[StateType]):
+        """
+        Wrap a problem so that it operates on interned state ids.
+        
+        Args:
+            problem: The problem to wrap
+            interner: The interner assigning the ids
+        """
+        self.problem = problem
+        self.interner = interner
+        
+        # Forward the optional lower bound used by the SPFA search
+        min_remaining_cost = getattr(problem, 'min_remaining_cost', None)
+        if min_remaining_cost is not None:
+            states = interner.states
+            self.min_remaining_cost = lambda state_id: min_remaining_cost(states[state_id])
+    
+    def initial_state(self) -> int:
+        """Return the id of the wrapped problem's initial state."""
+        return self.interner.intern(self.problem.initial_state())
+    
+    def is_goal(self, state: int) -> bool:
+        """Test the state with the given id against the wrapped goal test."""
+        return self.problem.is_goal(self.interner.states[state])
+    
+    def get_successors(self, state: int) -> List[Tuple[int, Any, float]]:
+        """
+        Generate the successors of the state with the given id.
+        
+        Args:
+            state: Id of the state to expand
+        
+        Returns:
+            List of (successor_id, action, step_cost) tuples
+        """
+        # StateInterner.intern() inlined: this runs once per generated node
+        to_id = self.interner.to_id
+        states = self.interner.states
+        successors = []
+        for next_state, action, step_cost in self.problem.get_successors(states[state]):
+            next_id = to_id.get(next_state)
+            if next_id is None:
+                next_id = to_id[next_state] = len(states)
+                states.append(next_state)
+            successors.append((next_id, action, step_cost))
+        return successors
+
+
+class InternedHeuristic(AbstractHeuristic[int]):
+    """
+    View of a heuristic evaluated on interned state ids.
+    
+    Attributes:
+        inner: The wrapped heuristic
+        interner: The StateInterner mapping states to ids
+    """
+    
+    def __init__(self, inner: AbstractHeuristic[StateType],
+                 interner: StateInterner[StateType]):
+        """
+        Wrap a heuristic so that it operates on interned state ids.
+        
+        Args:
+            inner: The heuristic to wrap
+            interner: The interner assigning the ids
+        """
+        self.inner = inner
+        self.interner = interner
+    
+    def __getattr__(self, name: str) -> Any:
+        """Read attributes the view doesn't define from the wrapped heuristic."""
+        if name == 'inner':
+            raise AttributeError(name)
+        return getattr(self.inner, name)
+    
+    def h(self, state: int) -> float:
+        """Return h(n) of the state with the given id."""
+        return self.inner.h(self.interner.states[state])
+    
+    def h_batch(self, states: Sequence[int]) -> Sequence[float]:
+        """Return h(n) of the states with the given ids, in one h_batch call."""
+        lookup = self.interner.states
+        return self.inner.h_batch([lookup[state] for state in states])
+    
+    def is_admissible(self) -> bool:
+        """Delegate to the wrapped heuristic."""
+        return self.inner.is_admissible()
+    
+    def is_consistent(self) -> bool:
+        """Delegate to the wrapped heuristic."""
+        return self.inner.is_consistent()
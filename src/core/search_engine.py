@@ -5,7 +5,11 @@ This module contains the problem-agnostic search engine that uses dependency
 injection to separate the search algorithm from problem-specific logic.
 """
 
-from typing import Set, Dict, Optional, Callable, Generic
+from array import array
+from collections import deque
+from functools import partial
+from importlib.util import find_spec
+from typing import Any, List, Set, Dict, Optional, Callable, Generic, Tuple
 from .types import (
     AbstractProblem,
     AbstractFrontier,
@@ -13,8 +17,91 @@ from .types import (
     Node,
     SearchResult,
     NullHeuristic,
-    StateType
+    MemoizedHeuristic,
+    StateType,
+    STRATEGY_UCS,
+    STRATEGY_BFS,
+    STRATEGY_DFS,
+    STRATEGY_ASTAR,
+    STRATEGY_GREEDY
 )
+from .interning import StateInterner, InternedProblem, InternedHeuristic
+
+# NumPy and Numba are optional and only power the batch relaxation and
+# compiled CSR fast paths. Importing them (and loading the kernels) is slow,
+# so at import time the engine only checks that they are installed;
+# _load_accelerators() imports them once a fast path is first chosen.
+_HAVE_NUMPY = find_spec('numpy') is not None
+_HAVE_NUMBA = _HAVE_NUMPY and find_spec('numba') is not None
+_accelerators_loaded = False
+np: Any = None
+relax_batch: Any = None
+graph_search_csr: Any = None
+
+
+_INF = float('inf')
+
+
+def _load_accelerators() -> None:
+    """
+    Import NumPy and the Numba kernels, once per process.
+    
+    Leaves np, relax_batch and graph_search_csr at None for the ones that
+    fail to import, so the engine falls back to its Python loops.
+    """
+    global _accelerators_loaded, np, relax_batch, graph_search_csr
+    if _accelerators_loaded:
+        return
+    _accelerators_loaded = True
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover - installed but not importable
+        return
+    from . import search_engine_numba
+    np = numpy
+    relax_batch = search_engine_numba.relax_batch
+    graph_search_csr = search_engine_numba.graph_search_csr
+
+
+def _own_attribute(fn: Callable[..., float], name: str) -> Any:
+    """
+    Return an attribute set on fn itself, or None.
+    
+    functools.wraps copies the wrapped function's __dict__, so a user wrapper
+    around a built-in priority function would otherwise inherit the markers
+    the engine keys its fast paths on, and the engine would run the built-in
+    in place of the wrapper. Such wrappers are recognized by __wrapped__.
+    
+    Args:
+        fn: A priority function
+        name: The attribute to look up
+    
+    Returns:
+        The attribute's value if fn owns it, None otherwise
+    """
+    if hasattr(fn, '__wrapped__'):
+        return None
+    return getattr(fn, '__dict__', {}).get(name)
+
+
+def _null_heuristic_variant(priority_fn: Callable[..., float]) -> Callable[..., float]:
+    """
+    Return the null_heuristic_variant of a priority function, if it has one.
+    
+    Args:
+        priority_fn: A priority function, possibly wrapped in functools.partial
+        
+    Returns:
+        The variant (re-wrapped in the same partial), or priority_fn itself
+    """
+    variant = _own_attribute(priority_fn, 'null_heuristic_variant')
+    if variant is not None:
+        return variant
+    if isinstance(priority_fn, partial):
+        variant = _own_attribute(priority_fn.func, 'null_heuristic_variant')
+        if variant is not None:
+            return partial(variant, *priority_fn.args, **priority_fn.keywords)
+    return priority_fn
 
 
 class SearchEngine(Generic[StateType]):
@@ -35,6 +122,7 @@ class SearchEngine(Generic[StateType]):
         heuristic: Heuristic function (NullHeuristic for uninformed search)
         graph_search: If True, use closed set to avoid revisiting states
         allow_revisit: If True, allow revisiting states with better cost
+        revisit_strategy: How improved states are revisited ('best_first' or 'spfa')
     
     Notes:
         For graphs with NON-NEGATIVE edge costs:
@@ -43,9 +131,64 @@ class SearchEngine(Generic[StateType]):
         For graphs with NEGATIVE edge costs:
             - Use graph_search=True, allow_revisit=True
             - This allows finding better paths to already-visited states
+            - revisit_strategy='spfa' switches to a label-correcting
+              (Shortest Path Faster Algorithm) loop that runs to completion
+              and returns the cheapest goal found. If the problem exposes
+              `min_remaining_cost(state)`, a lower bound on the cost still
+              needed to reach a goal, relaxations that can't beat the best
+              goal cost found so far are pruned
             - Warning: May not terminate if negative cycles exist
+        
+        Batch relaxation (optional, requires NumPy):
+            Problems whose states are integer ids in [0, num_states) can
+            expose a `num_states` attribute and a
+            `get_successors_batch(state) -> (next_states, step_costs)` method
+            returning two NumPy arrays. In best-first allow_revisit mode the
+            engine then keeps best costs in a float64 array and compares all
+            successors in one vectorized step, creating Nodes only for the
+            successors that improve. The action recorded for a batch
+            successor is the edge tuple (state, next_state). If Numba is
+            installed the comparison runs in a compiled kernel
+            (see search_engine_numba.relax_batch). For the built-in
+            priority functions, identified by their `strategy_flag`
+            attribute, the priorities of the improved successors are
+            computed from the batch directly instead of calling
+            priority_fn once per Node.
+        
+        Compiled graph search (optional, requires Numba):
+            Problems exposing `num_states` and a
+            `get_csr_graph() -> (indptr, next_states, step_costs, goal_states)`
+            method describe their whole graph as arrays: the successors of
+            state s are next_states[indptr[s]:indptr[s + 1]]. With
+            compiled=True, classic graph search with a built-in priority
+            function and a PriorityQueueFrontier then runs entirely in a
+            compiled loop (see search_engine_numba.graph_search_csr) and
+            returns the same result and statistics; see _search_graph_csr().
+        
+        State interning:
+            With intern_states=True the engine searches over dense integer
+            ids assigned to states as they are generated, so the closed set,
+            best costs, heuristic cache and frontier hash ints instead of
+            the states themselves (see src/core/interning.py).
+        
+        Closed bitmap:
+            For problems exposing `num_states` (integer states in
+            [0, num_states)), classic graph search keeps the closed set in a
+            bytearray bitmap instead of a Python set, so membership is a
+            single byte load.
+        
+        Null heuristic specialization:
+            A priority function can set a `null_heuristic_variant` attribute
+            naming an equivalent function that skips the h(n) call (e.g.
+            A*'s variant is UCS). When the heuristic is a NullHeuristic the
+            engine calls that variant instead. functools.partial wrappers
+            are unwrapped and re-applied to the variant. The attribute must
+            be set on the function itself: wrappers made with
+            functools.wraps inherit a copy of it, which is ignored.
     """
     
+    REVISIT_STRATEGIES = ('best_first', 'spfa')
+    
     def __init__(
         self,
         problem: AbstractProblem[StateType],
@@ -53,7 +196,10 @@ class SearchEngine(Generic[StateType]):
         priority_fn: Callable[[Node[StateType], AbstractHeuristic[StateType]], float],
         heuristic: Optional[AbstractHeuristic[StateType]] = None,
         graph_search: bool = True,
-        allow_revisit: bool = False
+        allow_revisit: bool = False,
+        revisit_strategy: str = 'best_first',
+        intern_states: bool = False,
+        compiled: bool = False
     ):
         """
         Initialize the search engine with injected dependencies.
@@ -61,23 +207,77 @@ class SearchEngine(Generic[StateType]):
         Args:
             problem: Problem definition (initial state, goal test, successors)
             frontier: Frontier data structure for node ordering
-            priority_fn: Function computing priority from (node, heuristic)
+            priority_fn: Function computing priority from (node, heuristic).
+                          Unless the heuristic is a NullHeuristic or already
+                          a MemoizedHeuristic, it is passed wrapped in a
+                          MemoizedHeuristic, which forwards other attributes
+                          to the heuristic (isinstance checks see the wrapper)
             heuristic: Heuristic function (optional, defaults to NullHeuristic)
             graph_search: If True, track visited states (Graph Search vs Tree Search)
             allow_revisit: If True, allow re-expanding states with improved cost.
                           Required for graphs with negative edge weights.
+            revisit_strategy: Only used when graph_search and allow_revisit are
+                          both True. 'best_first' (default) re-pushes improved
+                          states into the frontier; 'spfa' keeps a FIFO queue of
+                          improved states instead and ignores frontier and
+                          priority_fn.
+            intern_states: If True, search over integer ids of the states
+                          (see StateInterner) and map the solution path back
+                          to the real states. Pays off when states are costly
+                          to hash and compare (e.g. boards hashed in Python);
+                          small tuples already hash cheaply in C. Priority
+                          functions then see nodes whose state is the id.
+            compiled: If True, run classic graph search in the compiled loop
+                          when the problem exposes get_csr_graph() (see
+                          _search_graph_csr()). Falls back to the Python
+                          loops when Numba is missing or the configuration
+                          is not supported.
         
         Important:
             The default settings (graph_search=True, allow_revisit=False) assume
             NON-NEGATIVE edge costs. For problems with negative edges, set
             allow_revisit=True to find optimal solutions.
+        
+        Raises:
+            ValueError: If revisit_strategy is not a known strategy
         """
+        if revisit_strategy not in self.REVISIT_STRATEGIES:
+            raise ValueError(
+                f"Unknown revisit_strategy {revisit_strategy!r}, "
+                f"expected one of {self.REVISIT_STRATEGIES}"
+            )
+        
         self.problem = problem
         self.frontier = frontier
         self.priority_fn = priority_fn
         self.heuristic = heuristic if heuristic is not None else NullHeuristic()
         self.graph_search = graph_search
         self.allow_revisit = allow_revisit
+        self.revisit_strategy = revisit_strategy
+        self.intern_states = intern_states
+        self.compiled = compiled
+        
+        # Problem the loops use, built by _configure() from self.problem
+        # (the one it was built from is _problem_source): a view over
+        # interned state ids while _interning, the problem itself otherwise.
+        # One interner serves the engine's lifetime: ids depend only on
+        # states, and nodes left in the frontier keep theirs across searches.
+        self._interner: StateInterner[StateType] = StateInterner()
+        self._interning = intern_states
+        self._problem: AbstractProblem[Any] = problem
+        self._problem_source: Optional[AbstractProblem[StateType]] = None
+        
+        # Heuristic handed to priority_fn, built by _configure() from
+        # self.heuristic (the one it was built from is _heuristic_source)
+        self._heuristic: AbstractHeuristic[Any] = self.heuristic
+        self._heuristic_view: AbstractHeuristic[Any] = self.heuristic
+        self._heuristic_source: Optional[AbstractHeuristic[StateType]] = None
+        self._h_cache: Optional[Dict[Any, float]] = None
+        
+        # Priority function the loops call and its STRATEGY_* id (None for
+        # custom functions), resolved by _configure() from self.priority_fn
+        self._priority_fn: Callable[..., float] = priority_fn
+        self._strategy_flag: Optional[int] = None
         
         # Statistics tracking
         self.nodes_expanded = 0
@@ -87,9 +287,113 @@ class SearchEngine(Generic[StateType]):
         # Closed set for Graph Search
         self.closed: Set[StateType] = set()
         
+        # Closed bitmap replacing the closed set for integer-state problems
+        self.closed_bits: Optional[bytearray] = None
+        
         # Best cost tracking for allow_revisit mode
         # Maps state -> best path cost found so far
         self.best_cost: Dict[StateType, float] = {}
+        
+        # Cheapest goal cost seen so far (SPFA keeps searching past goals)
+        self.best_goal_cost = _INF
+        
+        # Vectorized best-cost array replacing best_cost in batch mode
+        self.best_cost_arr: Any = None
+        
+        # Fast paths that apply to the current configuration, decided by
+        # _configure(): batch relaxation and the compiled CSR loop
+        self.use_batch = False
+        self.use_compiled = False
+        
+        # Arrays the compiled loop works on, kept across searches: the CSR
+        # graph of _csr_problem and h(n) of every state under _csr_h_heuristic
+        self._csr_problem: Optional[AbstractProblem[Any]] = None
+        self._csr_arrays: Tuple[Any, ...] = ()
+        self._csr_h_heuristic: Optional[AbstractHeuristic[Any]] = None
+        self._csr_h: Any = None
+        
+        self._configure()
+    
+    def _configure(self) -> None:
+        """
+        Derive what the search loops use from the engine's public attributes.
+        
+        Runs at construction and again at the start of every search(), so
+        attributes reassigned between searches take effect. A wrapper is
+        only rebuilt when the object it wraps has changed.
+        """
+        # Nodes left in the frontier hold ids with interning and real states
+        # without, so they can't carry over when intern_states is toggled
+        if self.intern_states != self._interning:
+            frontier = self.frontier
+            while not frontier.is_empty():
+                frontier.pop()
+            self._interning = self.intern_states
+            self._problem_source = None
+            # The heuristic view reads states through the interner
+            self._heuristic_source = None
+        
+        # Problem the loops use
+        problem = self.problem
+        if problem is not self._problem_source:
+            self._problem_source = problem
+            self._problem = problem
+            if self._interning:
+                self._problem = InternedProblem(problem, self._interner)
+        
+        # Heuristic handed to priority_fn: memoized unless it is trivially
+        # zero or the caller already passed a MemoizedHeuristic
+        if self.heuristic is None:
+            self.heuristic = NullHeuristic()
+        heuristic = self.heuristic
+        if heuristic is not self._heuristic_source:
+            self._heuristic_source = heuristic
+            view: AbstractHeuristic[Any] = heuristic
+            if self._interning and not isinstance(heuristic, NullHeuristic):
+                view = InternedHeuristic(heuristic, self._interner)
+            self._heuristic_view = view
+            self._heuristic = view
+            self._h_cache = None
+            if not isinstance(heuristic, (NullHeuristic, MemoizedHeuristic)):
+                memo = MemoizedHeuristic(view)
+                self._heuristic = memo
+                self._h_cache = memo.cache
+        
+        # Priority function the loops call: h(n) is always 0 with a
+        # NullHeuristic, so use the variant that skips it when there is one
+        self._priority_fn = self.priority_fn
+        if isinstance(heuristic, NullHeuristic):
+            self._priority_fn = _null_heuristic_variant(self.priority_fn)
+        # STRATEGY_* id of a built-in priority function, None otherwise
+        self._strategy_flag = _own_attribute(self._priority_fn, 'strategy_flag')
+        
+        # Fast paths, from the current flags. num_states,
+        # get_successors_batch and get_csr_graph are optional problem
+        # extensions.
+        problem = self._problem
+        self.use_batch = (
+            _HAVE_NUMPY
+            and self.graph_search and self.allow_revisit
+            and self.revisit_strategy == 'best_first'
+            and hasattr(problem, 'get_successors_batch')
+            and hasattr(problem, 'num_states')
+        )
+        # Imported here: data_structures imports src.core, so a
+        # module-level import would be circular
+        from ..data_structures.priority_queue import PriorityQueueFrontier
+        self.use_compiled = (
+            self.compiled
+            and _HAVE_NUMBA
+            and self.graph_search and not self.allow_revisit
+            and self._strategy_flag is not None
+            and type(self.frontier) is PriorityQueueFrontier
+            and hasattr(problem, 'get_csr_graph')
+            and hasattr(problem, 'num_states')
+        )
+        if self.use_batch or self.use_compiled:
+            _load_accelerators()
+            self.use_batch = self.use_batch and np is not None
+            self.use_compiled = self.use_compiled and graph_search_csr is not None
     
     def search(self) -> SearchResult[StateType]:
         """
@@ -108,19 +412,46 @@ class SearchEngine(Generic[StateType]):
           (assumes non-negative costs)
         - graph_search=True, allow_revisit=True: Graph search with cost tracking
           (handles negative edges correctly)
+        - revisit_strategy='spfa': Label-correcting search, see _search_spfa()
+        - compiled=True, for problems exposing get_csr_graph() with Numba
+          installed: classic graph search in a compiled loop, see
+          _search_graph_csr()
+        
+        Each configuration runs its own specialized loop (_search_tree,
+        _search_graph, _search_graph_bits, _search_revisit,
+        _search_revisit_batch) with the successor expansion inlined, so the
+        configuration flags are not re-checked for every node. The loops
+        share one shape: hot attributes are bound to locals up front, the
+        successors of each expanded node go to the frontier in a single
+        push_many() call, and max_frontier_size is only checked right after
+        that call, since the frontier only grows on push.
         
         Returns:
             SearchResult containing solution path and statistics
         """
+        self._configure()
+        
         # Reset statistics
         self.nodes_expanded = 0
         self.nodes_generated = 0
         self.max_frontier_size = 0
         self.closed.clear()
         self.best_cost.clear()
+        self.best_goal_cost = _INF
+        # num_states and get_successors_batch are optional problem extensions
+        num_states: Optional[int] = getattr(self._problem, 'num_states', None)
+        self.closed_bits = None
+        if self.graph_search and not self.allow_revisit and num_states is not None:
+            self.closed_bits = bytearray(num_states)
+        if self.use_batch:
+            self.best_cost_arr = np.full(num_states, _INF)
+        # Only reset the cache the engine created; a caller's
+        # MemoizedHeuristic may be shared across searches on purpose
+        if self._h_cache is not None:
+            self._h_cache.clear()
         
         # Initialize with root node
-        initial_state = self.problem.initial_state()
+        initial_state = self._problem.initial_state()
         root_node = Node(
             state=initial_state,
             parent=None,
@@ -129,98 +460,654 @@ class SearchEngine(Generic[StateType]):
             depth=0
         )
         
+        if self.graph_search and self.allow_revisit and self.revisit_strategy == 'spfa':
+            return self._search_spfa(root_node)
+        # Nodes left in the frontier by the caller would change the search
+        if self.use_compiled and self.frontier.is_empty():
+            return self._search_graph_csr(root_node)
+        
         # Add root to frontier
-        priority = self.priority_fn(root_node, self.heuristic)
+        priority = self._priority_fn(root_node, self._heuristic)
         self.frontier.push(root_node, priority)
         self.nodes_generated = 1
+        self.max_frontier_size = len(self.frontier)
         
         # Track initial state cost
         if self.allow_revisit:
             self.best_cost[initial_state] = 0.0
+        if self.use_batch:
+            self.best_cost_arr[initial_state] = 0.0
+        
+        # The configuration is fixed for the whole search: pick the loop
+        # specialized for it once instead of branching on it per node
+        if not self.graph_search:
+            search_loop = self._search_tree
+        elif not self.allow_revisit:
+            if self.closed_bits is not None:
+                search_loop = self._search_graph_bits
+            else:
+                search_loop = self._search_graph
+        elif self.use_batch:
+            search_loop = self._search_revisit_batch
+        else:
+            search_loop = self._search_revisit
+        
+        return search_loop()
+    
+    def _search_tree(self) -> SearchResult[StateType]:
+        """
+        Main loop for Tree Search (graph_search=False).
+        
+        States may be generated and expanded any number of times.
+        
+        Returns:
+            SearchResult containing solution path and statistics
+        """
+        frontier = self.frontier
+        frontier_pop = frontier.pop
+        frontier_push_many = frontier.push_many
+        is_goal = self._problem.is_goal
+        get_successors = self._problem.get_successors
+        priority_fn = self._priority_fn
+        heuristic = self._heuristic
+        
+        while not frontier.is_empty():
+            current_node = frontier_pop()
+            state = current_node.state
+            
+            # Goal test
+            if is_goal(state):
+                return self._build_success_result(current_node)
+            
+            # Expand node
+            self.nodes_expanded += 1
+            node_cost = current_node.path_cost
+            node_depth = current_node.depth + 1
+            
+            children: List[Tuple[Node[StateType], float]] = []
+            for next_state, action, step_cost in get_successors(state):
+                child_node = Node(
+                    state=next_state,
+                    parent=current_node,
+                    action=action,
+                    path_cost=node_cost + step_cost,
+                    depth=node_depth
+                )
+                children.append((child_node, priority_fn(child_node, heuristic)))
+            
+            frontier_push_many(children)
+            self.nodes_generated += len(children)
+            
+            frontier_size = len(frontier)
+            if frontier_size > self.max_frontier_size:
+                self.max_frontier_size = frontier_size
+        
+        # No solution found
+        return self._build_failure_result()
+    
+    def _search_graph(self) -> SearchResult[StateType]:
+        """
+        Main loop for classic Graph Search with a closed set.
+        
+        NOTE: This assumes NON-NEGATIVE edge costs.
+        
+        Returns:
+            SearchResult containing solution path and statistics
+        """
+        frontier = self.frontier
+        frontier_pop = frontier.pop
+        frontier_push_many = frontier.push_many
+        is_goal = self._problem.is_goal
+        get_successors = self._problem.get_successors
+        priority_fn = self._priority_fn
+        heuristic = self._heuristic
+        closed = self.closed
+        
+        while not frontier.is_empty():
+            current_node = frontier_pop()
+            state = current_node.state
+            
+            # Skip if already visited. This comes before the goal test: a
+            # closed state was goal-tested when first popped, and the search
+            # would have returned then if it were a goal.
+            if state in closed:
+                continue
+            
+            # Goal test
+            if is_goal(state):
+                return self._build_success_result(current_node)
+            
+            # Mark as visited
+            closed.add(state)
+            
+            # Expand node
+            self.nodes_expanded += 1
+            node_cost = current_node.path_cost
+            node_depth = current_node.depth + 1
+            
+            children: List[Tuple[Node[StateType], float]] = []
+            for next_state, action, step_cost in get_successors(state):
+                if next_state in closed:
+                    continue
+                
+                child_node = Node(
+                    state=next_state,
+                    parent=current_node,
+                    action=action,
+                    path_cost=node_cost + step_cost,
+                    depth=node_depth
+                )
+                children.append((child_node, priority_fn(child_node, heuristic)))
+            
+            frontier_push_many(children)
+            self.nodes_generated += len(children)
+            
+            frontier_size = len(frontier)
+            if frontier_size > self.max_frontier_size:
+                self.max_frontier_size = frontier_size
+        
+        # No solution found
+        return self._build_failure_result()
+    
+    def _search_graph_bits(self) -> SearchResult[StateType]:
+        """
+        Main loop for classic Graph Search with the closed bitmap.
+        
+        Same as _search_graph() for integer-state problems exposing
+        num_states, with closed_bits in place of the closed set.
+        
+        Returns:
+            SearchResult containing solution path and statistics
+        """
+        frontier = self.frontier
+        frontier_pop = frontier.pop
+        frontier_push_many = frontier.push_many
+        is_goal = self._problem.is_goal
+        get_successors = self._problem.get_successors
+        priority_fn = self._priority_fn
+        heuristic = self._heuristic
+        # Typed as Any: states are integer ids here, which StateType can't express
+        closed_bits: Any = self.closed_bits
+        
+        while not frontier.is_empty():
+            current_node = frontier_pop()
+            state = current_node.state
+            
+            # Skip if already visited. This comes before the goal test: a
+            # closed state was goal-tested when first popped, and the search
+            # would have returned then if it were a goal.
+            if closed_bits[state]:
+                continue
+            
+            # Goal test
+            if is_goal(state):
+                return self._build_success_result(current_node)
+            
+            # Mark as visited
+            closed_bits[state] = 1
+            
+            # Expand node
+            self.nodes_expanded += 1
+            node_cost = current_node.path_cost
+            node_depth = current_node.depth + 1
+            
+            children: List[Tuple[Node[StateType], float]] = []
+            for next_state, action, step_cost in get_successors(state):
+                if closed_bits[next_state]:
+                    continue
+                
+                child_node = Node(
+                    state=next_state,
+                    parent=current_node,
+                    action=action,
+                    path_cost=node_cost + step_cost,
+                    depth=node_depth
+                )
+                children.append((child_node, priority_fn(child_node, heuristic)))
+            
+            frontier_push_many(children)
+            self.nodes_generated += len(children)
+            
+            frontier_size = len(frontier)
+            if frontier_size > self.max_frontier_size:
+                self.max_frontier_size = frontier_size
+        
+        # No solution found
+        return self._build_failure_result()
+    
+    def _search_revisit(self) -> SearchResult[StateType]:
+        """
+        Main loop for Graph Search with cost tracking (allow_revisit=True).
+        
+        A state is re-pushed whenever a path beats the best cost it was
+        expanded with, which handles negative edges.
+        
+        Returns:
+            SearchResult containing solution path and statistics
+        """
+        frontier = self.frontier
+        frontier_pop = frontier.pop
+        frontier_push_many = frontier.push_many
+        is_goal = self._problem.is_goal
+        get_successors = self._problem.get_successors
+        priority_fn = self._priority_fn
+        heuristic = self._heuristic
+        best_cost = self.best_cost
+        bc_get = best_cost.get
+        
+        # A state is only re-pushed when its cost beats the best popped cost,
+        # so with one entry per state a popped node is never a stale copy
+        check_stale = not frontier.unique_states
+        
+        while not frontier.is_empty():
+            current_node = frontier_pop()
+            state = current_node.state
+            
+            node_cost = current_node.path_cost
+            if check_stale and node_cost > bc_get(state, _INF):
+                # We've already found a better path to this state. The
+                # cheaper copy was goal-tested when popped, so a stale copy
+                # is never a goal the search hasn't seen: skip before is_goal.
+                continue
+            
+            # Goal test
+            if is_goal(state):
+                return self._build_success_result(current_node)
+            
+            # Update best cost for this state
+            best_cost[state] = node_cost
+            
+            # Expand node
+            self.nodes_expanded += 1
+            node_depth = current_node.depth + 1
+            
+            children: List[Tuple[Node[StateType], float]] = []
+            for next_state, action, step_cost in get_successors(state):
+                new_cost = node_cost + step_cost
+                
+                # Check if this path is better than any we've seen.
+                # best_cost is updated when popping, not here, so that
+                # multiple paths can compete in the frontier.
+                if new_cost >= bc_get(next_state, _INF):
+                    continue
+                
+                child_node = Node(
+                    state=next_state,
+                    parent=current_node,
+                    action=action,
+                    path_cost=new_cost,
+                    depth=node_depth
+                )
+                children.append((child_node, priority_fn(child_node, heuristic)))
+            
+            frontier_push_many(children)
+            self.nodes_generated += len(children)
+            
+            frontier_size = len(frontier)
+            if frontier_size > self.max_frontier_size:
+                self.max_frontier_size = frontier_size
+        
+        # No solution found
+        return self._build_failure_result()
+    
+    def _search_revisit_batch(self) -> SearchResult[StateType]:
+        """
+        Main loop for allow_revisit=True with batch relaxation.
+        
+        Same as _search_revisit() with best costs kept in best_cost_arr and
+        successors expanded by _expand_node_batch().
+        
+        Returns:
+            SearchResult containing solution path and statistics
+        """
+        frontier = self.frontier
+        frontier_pop = frontier.pop
+        is_goal = self._problem.is_goal
+        expand_node = self._expand_node_batch
+        best_cost = self.best_cost_arr
+        check_stale = not frontier.unique_states
         
-        # Main search loop
-        while not self.frontier.is_empty():
-            # Update statistics
-            self.max_frontier_size = max(self.max_frontier_size, len(self.frontier))
+        while not frontier.is_empty():
+            current_node = frontier_pop()
+            state = current_node.state
             
-            # Get next node to expand
-            current_node = self.frontier.pop()
+            node_cost = current_node.path_cost
+            if check_stale and node_cost > best_cost[state]:
+                # We've already found a better path to this state. The
+                # cheaper copy was goal-tested when popped, so a stale copy
+                # is never a goal the search hasn't seen: skip before is_goal.
+                continue
             
             # Goal test
-            if self.problem.is_goal(current_node.state):
+            if is_goal(state):
                 return self._build_success_result(current_node)
             
-            # Graph Search: Handle visited states
-            if self.graph_search:
-                if self.allow_revisit:
-                    # Check if we've found a better path to this state
-                    current_cost = current_node.path_cost
-                    best = self.best_cost.get(current_node.state, float('inf'))
-                    
-                    if current_cost > best:
-                        # We've already found a better path to this state
-                        continue
-                    
-                    # Update best cost for this state
-                    self.best_cost[current_node.state] = current_cost
-                else:
-                    # Classic graph search: skip if already visited
-                    # NOTE: This assumes NON-NEGATIVE edge costs
-                    if current_node.state in self.closed:
-                        continue
-                    
-                    # Mark as visited
-                    self.closed.add(current_node.state)
+            # Update best cost for this state
+            best_cost[state] = node_cost
             
             # Expand node
             self.nodes_expanded += 1
-            self._expand_node(current_node)
+            expand_node(current_node)
+            
+            frontier_size = len(frontier)
+            if frontier_size > self.max_frontier_size:
+                self.max_frontier_size = frontier_size
         
         # No solution found
         return self._build_failure_result()
     
-    def _expand_node(self, node: Node[StateType]) -> None:
+    def _expand_node_batch(self, node: Node[StateType]) -> None:
         """
-        Expand a node by generating its successors and adding them to frontier.
+        Expand a node using the problem's vectorized successor function.
+        
+        All successor costs are computed and compared against best_cost_arr
+        in a single NumPy step (or the compiled relax_batch kernel when Numba
+        is available); Python Nodes are only created for the successors that
+        improve.
         
         Args:
-            node: The node to expand
+            node: The node to expand (its state is an integer id)
         """
-        # Get successors from problem definition
-        successors = self.problem.get_successors(node.state)
-        
-        for next_state, action, step_cost in successors:
-            # Calculate new path cost
-            new_cost = node.path_cost + step_cost
-            
-            # Graph Search: Handle visited states
-            if self.graph_search:
-                if self.allow_revisit:
-                    # Check if this path is better than any we've seen
-                    best = self.best_cost.get(next_state, float('inf'))
-                    if new_cost >= best:
-                        # Not an improvement, skip
-                        continue
-                    # Note: We don't update best_cost here, we do it when popping
-                    # This allows multiple paths to compete in the frontier
-                else:
-                    # Classic graph search: skip if already in closed set
-                    if next_state in self.closed:
-                        continue
-            
-            # Create child node
-            child_node = Node(
+        state = node.state
+        node_cost = node.path_cost
+        next_states, step_costs = getattr(self._problem, 'get_successors_batch')(state)
+        
+        if relax_batch is not None:
+            # The compiled kernel has a fixed int64/float64 signature
+            next_states = np.asarray(next_states, dtype=np.int64)
+            step_costs = np.asarray(step_costs, dtype=np.float64)
+            improved = np.flatnonzero(
+                relax_batch(node_cost, next_states, step_costs, self.best_cost_arr)
+            )
+        else:
+            improved = np.flatnonzero(
+                node_cost + step_costs < self.best_cost_arr[next_states]
+            )
+        
+        depth = node.depth + 1
+        
+        # tolist() converts to Python ints/floats in one pass
+        new_states = next_states[improved].tolist()
+        new_costs = (node_cost + step_costs[improved]).tolist()
+        child_nodes = [
+            Node(
                 state=next_state,
                 parent=node,
-                action=action,
+                action=(state, next_state),
                 path_cost=new_cost,
-                depth=node.depth + 1
+                depth=depth
             )
+            for next_state, new_cost in zip(new_states, new_costs)
+        ]
+        
+        children: List[Tuple[Node[StateType], float]]
+        if self._strategy_flag is None:
+            priority_fn = self._priority_fn
+            heuristic = self._heuristic
+            children = [(child_node, priority_fn(child_node, heuristic))
+                        for child_node in child_nodes]
+        else:
+            # Built-in strategy: no priority_fn call per successor
+            priorities = self._batch_priorities(new_states, new_costs, depth)
+            children = list(zip(child_nodes, priorities))
+        
+        self.frontier.push_many(children)
+        self.nodes_generated += len(children)
+    
+    def _batch_priorities(self, states: List[Any], costs: List[float],
+                          depth: int) -> List[float]:
+        """
+        Compute the priorities of a batch of successors without calling priority_fn.
+        
+        Only used for the built-in priority functions (see strategy_flag),
+        whose priority depends on g(n), depth and h(n) alone, so it can be
+        computed straight from the lists the batch path already has.
+        
+        Args:
+            states: Integer ids of the successor states
+            costs: Their path costs g(n)
+            depth: Depth shared by all successors
             
-            # Compute priority and add to frontier
-            priority = self.priority_fn(child_node, self.heuristic)
-            self.frontier.push(child_node, priority)
-            self.nodes_generated += 1
+        Returns:
+            One priority per successor, equal to what priority_fn returns
+        """
+        strategy = self._strategy_flag
+        if strategy == STRATEGY_UCS:
+            return costs
+        if strategy == STRATEGY_BFS:
+            return [float(depth)] * len(costs)
+        if strategy == STRATEGY_DFS:
+            return [-float(depth)] * len(costs)
+        
+        h_values = self._heuristic.h_batch(states)
+        if strategy == STRATEGY_ASTAR:
+            return [g + h for g, h in zip(costs, h_values)]
+        return list(h_values)
+    
+    def _search_spfa(self, root_node: Node[StateType]) -> SearchResult[StateType]:
+        """
+        Run the SPFA (Shortest Path Faster Algorithm) label-correcting loop.
+        
+        Instead of pushing every improved successor into the frontier, a FIFO
+        queue holds the states whose cost improved since they were last
+        expanded, and each state is queued at most once at a time. When a
+        state is popped, its current best label is expanded. The SLF (Smallest
+        Label First) refinement puts a state at the front of the queue when
+        it is cheaper than the current head.
+        
+        Every relaxation records a label (state, parent label, action, cost)
+        in parallel arrays rather than allocating a Node, since most labels
+        are superseded before the search ends. Nodes are only built for the
+        path to the returned goal.
+        
+        Goals cannot be accepted on their first pop because a later negative
+        edge may still improve them, so the loop runs until no state improves
+        and returns the cheapest goal node found. Once a goal is known, and if
+        the problem provides min_remaining_cost(state), states and successors
+        whose cost plus that lower bound can't beat best_goal_cost are pruned.
+        Relaxations never reach infinite-cost states, since new_cost must
+        beat a finite best cost.
+        
+        Args:
+            root_node: The node of the initial state
+            
+        Returns:
+            SearchResult with the cheapest goal path found, or failure
+        """
+        best_cost = self.best_cost
+        bc_get = best_cost.get
+        root_state = root_node.state
+        best_cost[root_state] = 0.0
+        
+        # Labels are stored as parallel arrays indexed by label id instead of
+        # one Node per relaxation; label 0 is the root, with parent id -1
+        label_state: List[StateType] = [root_state]
+        label_parent: List[int] = [-1]
+        label_action: List[Any] = [None]
+        label_cost = array('d', [0.0])
+        best_label: Dict[StateType, int] = {root_state: 0}
+        
+        queue = deque([root_state])
+        in_queue: Set[StateType] = {root_state}
+        self.nodes_generated = 1
+        self.max_frontier_size = 1
+        goal_states: Set[StateType] = set()
+        is_goal = self._problem.is_goal
+        get_successors = self._problem.get_successors
+        min_remaining = getattr(self._problem, 'min_remaining_cost', None)
+        
+        while queue:
+            state = queue.popleft()
+            in_queue.discard(state)
+            label = best_label[state]
+            node_cost = label_cost[label]
+            
+            # Goal test: remember the goal and its cost, keep relaxing.
+            # Goals are only re-queued when their cost improves.
+            if state in goal_states or is_goal(state):
+                goal_states.add(state)
+                if node_cost < self.best_goal_cost:
+                    self.best_goal_cost = node_cost
+            elif (min_remaining is not None
+                  and node_cost + min_remaining(state) >= self.best_goal_cost):
+                # Queued before the current best goal was found
+                continue
+            
+            self.nodes_expanded += 1
+            
+            for next_state, action, step_cost in get_successors(state):
+                new_cost = node_cost + step_cost
+                if new_cost >= bc_get(next_state, _INF):
+                    continue
+                if (min_remaining is not None
+                        and new_cost + min_remaining(next_state) >= self.best_goal_cost):
+                    continue
+                
+                best_cost[next_state] = new_cost
+                best_label[next_state] = len(label_state)
+                label_state.append(next_state)
+                label_parent.append(label)
+                label_action.append(action)
+                label_cost.append(new_cost)
+                self.nodes_generated += 1
+                
+                if next_state not in in_queue:
+                    in_queue.add(next_state)
+                    # SLF: cheaper than the head goes to the front
+                    if queue and new_cost < best_cost[queue[0]]:
+                        queue.appendleft(next_state)
+                    else:
+                        queue.append(next_state)
+            
+            frontier_size = len(queue)
+            if frontier_size > self.max_frontier_size:
+                self.max_frontier_size = frontier_size
+        
+        if not goal_states:
+            return self._build_failure_result()
+        
+        # Costs only settle once the queue drains, so pick the goal now
+        goal_state = min(goal_states, key=best_cost.__getitem__)
+        
+        # Walk the parent ids back to the root, then build Nodes for the
+        # goal path only
+        chain: List[int] = []
+        label = best_label[goal_state]
+        while label != -1:
+            chain.append(label)
+            label = label_parent[label]
+        
+        goal_node = root_node
+        for depth, label in enumerate(reversed(chain[:-1]), 1):
+            goal_node = Node(
+                state=label_state[label],
+                parent=goal_node,
+                action=label_action[label],
+                path_cost=label_cost[label],
+                depth=depth
+            )
+        return self._build_success_result(goal_node)
+    
+    def _search_graph_csr(self, root_node: Node[StateType]) -> SearchResult[StateType]:
+        """
+        Run classic graph search in the compiled graph_search_csr kernel.
+        
+        The kernel reproduces _search_graph_bits() with a
+        PriorityQueueFrontier, including tie-breaking and statistics, but
+        works on the arrays from get_csr_graph() and never touches the
+        frontier or priority_fn: the priority is computed from the
+        strategy flag. For A* and Greedy, h(n) is evaluated for every state
+        in one h_batch() call, since the kernel can't call back into Python.
+        
+        The CSR arrays and the h(n) array are kept across searches and only
+        rebuilt when engine.problem or engine.heuristic is reassigned, so
+        the graph and the heuristic must not change in place in between.
+        
+        Nodes are only built for the path to the goal. The kernel doesn't
+        see actions, so each step's action is looked up in get_successors()
+        of its parent: the first edge to the child state with a matching
+        step cost, which is the edge the Python loop keeps.
+        
+        Args:
+            root_node: The node of the initial state
+        
+        Returns:
+            SearchResult containing solution path and statistics
+        """
+        problem = self._problem
+        num_states: int = getattr(problem, 'num_states')
+        if self._csr_problem is not problem:
+            indptr, next_states, step_costs, goal_states = getattr(
+                problem, 'get_csr_graph')()
+            goal_mask = np.zeros(num_states, dtype=np.bool_)
+            goal_mask[np.asarray(goal_states, dtype=np.int64)] = True
+            self._csr_arrays = (
+                np.asarray(indptr, dtype=np.int64),
+                np.asarray(next_states, dtype=np.int64),
+                np.asarray(step_costs, dtype=np.float64),
+                goal_mask
+            )
+            self._csr_problem = problem
+            self._csr_h_heuristic = None
+        
+        strategy = self._strategy_flag
+        if strategy == STRATEGY_ASTAR or strategy == STRATEGY_GREEDY:
+            if self._csr_h_heuristic is not self._heuristic:
+                # The h array already holds every state, so the engine's own
+                # memo is bypassed; a caller's MemoizedHeuristic is not
+                heuristic = self._heuristic
+                if self._h_cache is not None:
+                    heuristic = self._heuristic_view
+                self._csr_h = np.asarray(
+                    heuristic.h_batch(range(num_states)), dtype=np.float64)
+                self._csr_h_heuristic = self._heuristic
+            h = self._csr_h
+        else:
+            h = np.zeros(0, dtype=np.float64)
+        
+        indptr, next_states, step_costs, goal_mask = self._csr_arrays
+        goal, parent, path_cost, depth, stats = graph_search_csr(
+            indptr,
+            next_states,
+            step_costs,
+            goal_mask,
+            h,
+            strategy,
+            root_node.state
+        )
+        self.nodes_expanded = int(stats[0])
+        self.nodes_generated = int(stats[1])
+        self.max_frontier_size = int(stats[2])
+        
+        if goal < 0:
+            return self._build_failure_result()
+        
+        # Walk the parent array back to the root, then build Nodes for the
+        # goal path only
+        chain: List[int] = []
+        state = int(goal)
+        while state != root_node.state:
+            chain.append(state)
+            state = int(parent[state])
+        
+        get_successors = self._problem.get_successors
+        goal_node: Node[Any] = root_node
+        for state in reversed(chain):
+            cost = float(path_cost[state])
+            node_cost = goal_node.path_cost
+            action = None
+            for next_state, next_action, step_cost in get_successors(goal_node.state):
+                if next_state == state and node_cost + step_cost == cost:
+                    action = next_action
+                    break
+            goal_node = Node(
+                state=state,
+                parent=goal_node,
+                action=action,
+                path_cost=cost,
+                depth=int(depth[state])
+            )
+        return self._build_success_result(goal_node)
     
     def _build_success_result(self, goal_node: Node[StateType]) -> SearchResult[StateType]:
         """
@@ -232,16 +1119,14 @@ class SearchEngine(Generic[StateType]):
         Returns:
             SearchResult with solution path and statistics
         """
-        path, actions = self._reconstruct_path(goal_node)
-        
+        if self._interning:
+            goal_node = self._restore_states(goal_node)
         return SearchResult(
             success=True,
             goal_node=goal_node,
             nodes_expanded=self.nodes_expanded,
             nodes_generated=self.nodes_generated,
             max_frontier_size=self.max_frontier_size,
-            path=path,
-            actions=actions,
             total_cost=goal_node.path_cost
         )
     
@@ -258,37 +1143,37 @@ class SearchEngine(Generic[StateType]):
             nodes_expanded=self.nodes_expanded,
             nodes_generated=self.nodes_generated,
             max_frontier_size=self.max_frontier_size,
-            path=[],
-            actions=[],
-            total_cost=float('inf')
+            total_cost=_INF
         )
     
-    def _reconstruct_path(self, goal_node: Node[StateType]) -> tuple:
+    def _restore_states(self, goal_node: Node[Any]) -> Node[StateType]:
         """
-        Reconstruct the path from initial state to goal by following parent links.
+        Rebuild the path to an interned goal node with the real states.
         
         Args:
-            goal_node: The goal node to trace back from
+            goal_node: Goal node whose path holds interned state ids
             
         Returns:
-            Tuple of (path, actions) where:
-                - path: List of states from initial to goal
-                - actions: List of actions taken
+            Equivalent goal node whose path holds the original states
         """
-        path = []
-        actions = []
-        current = goal_node
-        
-        # Trace back to root
+        states = self._interner.states
+        chain: List[Node[Any]] = []
+        current: Optional[Node[Any]] = goal_node
         while current is not None:
-            path.append(current.state)
-            if current.action is not None:
-                actions.append(current.action)
+            chain.append(current)
             current = current.parent
         
-        # Reverse to get initial -> goal order
-        path.reverse()
-        actions.reverse()
-        
-        return path, actions
+        # Indexed instead of reversed(chain): mypyc can't compile reversed()
+        # over a list of Node[Any]
+        restored: Optional[Node[StateType]] = None
+        for i in range(len(chain) - 1, -1, -1):
+            node = chain[i]
+            restored = Node(
+                state=states[node.state],
+                parent=restored,
+                action=node.action,
+                path_cost=node.path_cost,
+                depth=node.depth
+            )
+        return restored  # type: ignore[return-value]
 
@@ -0,0 +1,218 @@
+"""
+Optional Numba kernels for the search engine's integer-state fast paths.
+
+The kernels operate on integer state ids and NumPy arrays: relax_batch
+replaces the per-edge comparison of the batch relaxation path, and
+graph_search_csr runs a whole classic graph search over a CSR graph.
+Numba is an optional dependency: when it is not installed, both are None
+and the engine falls back to its Python loops.
+"""
+
+from .types import (
+    STRATEGY_UCS,
+    STRATEGY_BFS,
+    STRATEGY_DFS,
+    STRATEGY_ASTAR,
+    STRATEGY_GREEDY
+)
+
+try:
+    import numba as nb
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised without numba installed
+    nb = None  # type: ignore[assignment]
+
+
+if nb is not None:
+
+    # Explicit signature: compiled eagerly, no type inference at call time.
+    # cache=True keeps the compiled kernel on disk between interpreter runs.
+    @nb.njit(
+        nb.boolean[:](nb.float64, nb.int64[:], nb.float64[:], nb.float64[:]),
+        cache=True,
+        fastmath=False
+    )
+    def relax_batch(u_cost, neighbors, weights, dist):
+        """
+        Compute which successors of a node improve when its edges are relaxed.
+        
+        Args:
+            u_cost: Path cost g(u) of the node being expanded
+            neighbors: Integer ids of the successor states
+            weights: Step cost of the edge to each successor
+            dist: Best known path cost per state id (read only)
+        
+        Returns:
+            Boolean mask, True where u_cost + weight < dist[neighbor]
+        """
+        n = neighbors.shape[0]
+        relaxed = np.empty(n, dtype=np.bool_)
+        for i in range(n):
+            relaxed[i] = u_cost + weights[i] < dist[neighbors[i]]
+        return relaxed
+    
+    @nb.njit(inline='always')
+    def _entry_less(keys, counters, i, j):
+        """Order heap slots i and j by (priority, counter)."""
+        if keys[i] != keys[j]:
+            return keys[i] < keys[j]
+        return counters[i] < counters[j]
+    
+    @nb.njit(cache=True, boundscheck=False)
+    def graph_search_csr(indptr, next_states, step_costs, goal_mask, h,
+                         strategy, root):
+        """
+        Run classic graph search (closed set, no revisits) over a CSR graph.
+        
+        Mirrors SearchEngine._search_graph_bits() with a
+        PriorityQueueFrontier: the frontier is a binary heap of
+        (priority, counter, state) slots with lazy deletion, a push is
+        dropped when the state's live entry has a lower or equal priority,
+        and the statistics are counted the same way.
+        
+        Args:
+            indptr: Successors of state s are next_states[indptr[s]:indptr[s + 1]]
+            next_states: Successor state ids, grouped by source state
+            step_costs: Step cost of each edge in next_states
+            goal_mask: True for goal states
+            h: h(n) per state id (only read for A* and Greedy)
+            strategy: STRATEGY_* id of the priority function
+            root: Id of the initial state
+        
+        Returns:
+            Tuple of (goal, parent, path_cost, depth, stats) where goal is the
+            goal state id or -1, parent/path_cost/depth describe the node
+            last pushed for each state, and stats holds nodes_expanded,
+            nodes_generated and max_frontier_size
+        """
+        num_states = indptr.shape[0] - 1
+        capacity = next_states.shape[0] + 1
+        
+        # Heap slots: priority, counter and state of each entry
+        keys = np.empty(capacity, dtype=np.float64)
+        counters = np.empty(capacity, dtype=np.int64)
+        heap_states = np.empty(capacity, dtype=np.int64)
+        size = 0
+        
+        # Per-state live frontier entry (live_counter == -1: none)
+        live_counter = np.full(num_states, -1, dtype=np.int64)
+        live_key = np.empty(num_states, dtype=np.float64)
+        closed = np.zeros(num_states, dtype=np.bool_)
+        
+        parent = np.full(num_states, -1, dtype=np.int64)
+        path_cost = np.zeros(num_states, dtype=np.float64)
+        depth = np.zeros(num_states, dtype=np.int64)
+        stats = np.zeros(3, dtype=np.int64)
+        
+        # Root priority, as the priority functions compute it for g = 0
+        if strategy == STRATEGY_ASTAR:
+            root_key = 0.0 + h[root]
+        elif strategy == STRATEGY_GREEDY:
+            root_key = h[root]
+        else:
+            root_key = 0.0
+        keys[0] = root_key
+        counters[0] = 0
+        heap_states[0] = root
+        size = 1
+        counter = 1
+        live_counter[root] = 0
+        live_key[root] = root_key
+        live = 1
+        stats[1] = 1
+        stats[2] = 1
+        
+        while live > 0:
+            # Pop the minimum slot, sifting the last slot down into its place
+            state = heap_states[0]
+            count = counters[0]
+            size -= 1
+            if size > 0:
+                keys[0] = keys[size]
+                counters[0] = counters[size]
+                heap_states[0] = heap_states[size]
+                i = 0
+                while True:
+                    smallest = i
+                    left = 2 * i + 1
+                    right = left + 1
+                    if left < size and _entry_less(keys, counters, left, smallest):
+                        smallest = left
+                    if right < size and _entry_less(keys, counters, right, smallest):
+                        smallest = right
+                    if smallest == i:
+                        break
+                    keys[i], keys[smallest] = keys[smallest], keys[i]
+                    counters[i], counters[smallest] = counters[smallest], counters[i]
+                    heap_states[i], heap_states[smallest] = heap_states[smallest], heap_states[i]
+                    i = smallest
+            
+            # Lazily deleted entry
+            if live_counter[state] != count:
+                continue
+            live_counter[state] = -1
+            live -= 1
+            
+            if closed[state]:
+                continue
+            if goal_mask[state]:
+                return state, parent, path_cost, depth, stats
+            closed[state] = True
+            stats[0] += 1
+            
+            node_cost = path_cost[state]
+            node_depth = depth[state] + 1
+            for e in range(indptr[state], indptr[state + 1]):
+                next_state = next_states[e]
+                if closed[next_state]:
+                    continue
+                stats[1] += 1
+                
+                child_cost = node_cost + step_costs[e]
+                if strategy == STRATEGY_UCS:
+                    key = child_cost
+                elif strategy == STRATEGY_BFS:
+                    key = float(node_depth)
+                elif strategy == STRATEGY_DFS:
+                    key = -float(node_depth)
+                elif strategy == STRATEGY_ASTAR:
+                    key = child_cost + h[next_state]
+                else:
+                    key = h[next_state]
+                
+                # Keep the live entry if it is at least as good
+                if live_counter[next_state] != -1:
+                    if key >= live_key[next_state]:
+                        continue
+                else:
+                    live += 1
+                live_counter[next_state] = counter
+                live_key[next_state] = key
+                parent[next_state] = state
+                path_cost[next_state] = child_cost
+                depth[next_state] = node_depth
+                
+                # Push, sifting the new slot up
+                i = size
+                keys[i] = key
+                counters[i] = counter
+                heap_states[i] = next_state
+                size += 1
+                counter += 1
+                while i > 0:
+                    up = (i - 1) // 2
+                    if not _entry_less(keys, counters, i, up):
+                        break
+                    keys[i], keys[up] = keys[up], keys[i]
+                    counters[i], counters[up] = counters[up], counters[i]
+                    heap_states[i], heap_states[up] = heap_states[up], heap_states[i]
+                    i = up
+            
+            if live > stats[2]:
+                stats[2] = live
+        
+        return -1, parent, path_cost, depth, stats
+
+else:
+    relax_batch = None
+    graph_search_csr = None
@@ -6,15 +6,26 @@ and Inversion of Control in the search engine architecture.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, List, Tuple, Optional, Generic, TypeVar
+from typing import Any, Dict, List, Tuple, Optional, Generic, Sequence, TypeVar, overload
 from dataclasses import dataclass
 
 
 # Type variable for generic state representation
 StateType = TypeVar('StateType')
 
+# Integer ids of the built-in priority strategies. The built-in priority
+# functions carry theirs as a `strategy_flag` attribute, so the engine can
+# compute their priorities for a whole batch of successors at once.
+STRATEGY_UCS = 0
+STRATEGY_BFS = 1
+STRATEGY_DFS = 2
+STRATEGY_ASTAR = 3
+STRATEGY_GREEDY = 4
+
+# Cached h(n) values a MemoizedHeuristic keeps before resetting its cache
+DEFAULT_H_CACHE_SIZE = 1_000_000
+
 
-@dataclass
 class Node(Generic[StateType]):
     """
     Represents a node in the search tree.
@@ -25,16 +36,57 @@ class Node(Generic[StateType]):
         action: The action taken to reach this state from parent
         path_cost: The cumulative cost g(n) from the initial state
         depth: The depth of this node in the search tree
+    
+    The state's hash is computed the first time the node is hashed and
+    cached, since states such as tuples or frozensets rehash their contents
+    on every call. The engine keys its sets and dicts on node.state, not on
+    nodes, so most nodes are never hashed and never pay for it.
+    
+    Nodes are created once per generated successor, so the class declares
+    __slots__: no per-instance __dict__ and faster attribute access.
     """
-    state: StateType
-    parent: Optional['Node[StateType]'] = None
-    action: Optional[Any] = None
-    path_cost: float = 0.0
-    depth: int = 0
+    __slots__ = ('state', 'parent', 'action', 'path_cost', 'depth', '_state_hash')
+    
+    def __init__(
+        self,
+        state: StateType,
+        parent: Optional['Node[StateType]'] = None,
+        action: Optional[Any] = None,
+        path_cost: float = 0.0,
+        depth: int = 0
+    ):
+        """Create a node; the hash of its (immutable) state is computed lazily."""
+        self.state = state
+        self.parent = parent
+        self.action = action
+        self.path_cost = path_cost
+        self.depth = depth
+        # -1 means not computed yet: hash() never returns -1 in CPython
+        self._state_hash = -1
+    
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return (
+            f"Node(state={self.state!r}, parent={self.parent!r}, "
+            f"action={self.action!r}, path_cost={self.path_cost!r}, "
+            f"depth={self.depth!r})"
+        )
     
     def __hash__(self) -> int:
-        """Enable nodes to be used in sets/dicts via state hashing."""
-        return hash(self.state)
+        """Enable nodes to be used in sets/dicts via the cached state hash."""
+        state_hash = self._state_hash
+        if state_hash == -1:
+            state_hash = self._state_hash = hash(self.state)
+        return state_hash
+    
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """
+        Pickle a node by its constructor arguments.
+        
+        The cached state hash is left out: string hashes are randomized per
+        process, so an unpickled node recomputes it on first use.
+        """
+        return (Node, (self.state, self.parent, self.action, self.path_cost, self.depth))
     
     def __eq__(self, other: object) -> bool:
         """Equality based on state comparison."""
@@ -136,6 +188,25 @@ class AbstractHeuristic(ABC, Generic[StateType]):
         """
         pass
     
+    def h_batch(self, states: Sequence[StateType]) -> Sequence[float]:
+        """
+        Calculate the heuristic estimates of several states at once.
+        
+        The search engine calls this with all successors of an expanded
+        node when it can. The default calls h() once per state; heuristics
+        over array-friendly states (grid coordinates, lat/lon pairs) can
+        override it with a vectorized version, e.g. returning a NumPy
+        array. Values must equal what h() returns for each state.
+        
+        Args:
+            states: The states to evaluate
+            
+        Returns:
+            Sequence with the estimate of each state, in order
+        """
+        h = self.h
+        return [h(state) for state in states]
+    
     @abstractmethod
     def is_admissible(self) -> bool:
         """
@@ -169,8 +240,16 @@ class AbstractFrontier(ABC, Generic[StateType]):
     - Stack (LIFO) for DFS
     - Queue (FIFO) for BFS
     - Priority Queue for UCS, A*, Greedy
+    
+    Attributes:
+        unique_states: True if the frontier never holds two entries for the
+            same state (duplicates are rejected or lazily deleted). The
+            search engine then knows a popped node can't be a stale copy
+            and skips its stale-entry check.
     """
     
+    unique_states: bool = False
+    
     @abstractmethod
     def push(self, node: Node[StateType], priority: float) -> None:
         """
@@ -182,6 +261,71 @@ class AbstractFrontier(ABC, Generic[StateType]):
         """
         pass
     
+    def push_or_decrease(self, node: Node[StateType], priority: float) -> None:
+        """
+        Insert a node, or lower the priority of its state if already present.
+        
+        The search engine calls this when relaxing successors. Frontiers with
+        decrease-key support override it; the default is a plain push.
+        
+        Args:
+            node: The node to insert
+            priority: The priority value (lower = higher priority for min-heap)
+        """
+        self.push(node, priority)
+    
+    def push_many(self, items: List[Tuple[Node[StateType], float]]) -> None:
+        """
+        Insert several nodes, same as calling push_or_decrease() on each.
+        
+        The search engine passes all successors of an expanded node in one
+        call. Frontiers that can insert a batch more cheaply than item by
+        item override it; the default loops over push_or_decrease().
+        
+        Args:
+            items: (node, priority) pairs, in generation order
+        """
+        push_or_decrease = self.push_or_decrease
+        for node, priority in items:
+            push_or_decrease(node, priority)
+    
+    def peek_min_priority(self) -> float:
+        """
+        Return the lowest priority in the frontier without removing its node.
+        
+        Bidirectional search uses it to stop once the two frontiers' minima
+        show that no meeting point can beat the best path found. Frontiers
+        ordered by priority override it; the default raises, since FIFO and
+        LIFO frontiers ignore priorities.
+        
+        Returns:
+            The priority of the node pop() would return
+        
+        Raises:
+            IndexError: If the frontier is empty
+            NotImplementedError: If the frontier does not track priorities
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not track priorities")
+    
+    def remove_state(self, state: StateType) -> Node[StateType]:
+        """
+        Remove the node of a state from the frontier, wherever it is.
+        
+        Bidirectional search uses it to drop a state settled by the other
+        direction. The default raises; the built-in frontiers override it.
+        
+        Args:
+            state: The state to remove
+        
+        Returns:
+            The removed node
+        
+        Raises:
+            KeyError: If no node with this state is in the frontier
+            NotImplementedError: If the frontier does not support removal
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support remove_state()")
+    
     @abstractmethod
     def pop(self) -> Node[StateType]:
         """
@@ -241,6 +385,10 @@ class NullHeuristic(AbstractHeuristic[StateType]):
         """Return zero for all states."""
         return 0.0
     
+    def h_batch(self, states: Sequence[StateType]) -> Sequence[float]:
+        """Return zero for all states."""
+        return [0.0] * len(states)
+    
     def is_admissible(self) -> bool:
         """Null heuristic is trivially admissible."""
         return True
@@ -250,11 +398,144 @@ class NullHeuristic(AbstractHeuristic[StateType]):
         return True
 
 
+class MemoizedHeuristic(AbstractHeuristic[StateType]):
+    """
+    Heuristic wrapper that caches h(n) per state.
+    
+    States re-entering the frontier (common with allow_revisit=True or
+    inconsistent heuristics) reuse the cached estimate instead of
+    recomputing it, which pays off for expensive heuristics (landmarks,
+    pattern databases, learned models). The cache is cleared once it holds
+    max_size entries to bound memory.
+    
+    SearchEngine wraps every heuristic other than NullHeuristic in one of
+    these, cleared at the start of each search. Pass a MemoizedHeuristic
+    yourself to share its cache across several searches. Attributes the
+    wrapper doesn't define are read from the wrapped heuristic.
+    
+    Attributes:
+        inner: The wrapped heuristic
+        cache: Dict mapping states to their h(n) value
+        max_size: Maximum number of cached values
+    """
+    
+    def __init__(self, inner: AbstractHeuristic[StateType], max_size: int = DEFAULT_H_CACHE_SIZE):
+        """
+        Wrap a heuristic with a per-state cache.
+        
+        Args:
+            inner: The heuristic to memoize
+            max_size: Maximum number of cached values
+        """
+        self.inner = inner
+        self.cache: Dict[StateType, float] = {}
+        self.max_size = max_size
+    
+    def __getattr__(self, name: str) -> Any:
+        """
+        Forward attributes the wrapper lacks to the wrapped heuristic.
+        
+        Priority functions receive the wrapper in place of the heuristic
+        they were written for, so attributes such as a weight must still
+        resolve.
+        """
+        # inner itself is missing while unpickling or copying
+        if name == 'inner':
+            raise AttributeError(name)
+        return getattr(self.inner, name)
+    
+    def h(self, state: StateType) -> float:
+        """Return the cached h(n), computing it on first use."""
+        cache = self.cache
+        value = cache.get(state)
+        if value is None:
+            if len(cache) >= self.max_size:
+                cache.clear()
+            value = cache[state] = self.inner.h(state)
+        return value
+    
+    def h_batch(self, states: Sequence[StateType]) -> Sequence[float]:
+        """
+        Return the cached h(n) of several states.
+        
+        Only the states missing from the cache are passed on, in one call,
+        to the wrapped heuristic's h_batch().
+        
+        Args:
+            states: The states to evaluate
+            
+        Returns:
+            List with the estimate of each state, in order
+        """
+        cache = self.cache
+        values = [cache.get(state) for state in states]
+        missing = [state for state, value in zip(states, values) if value is None]
+        if not missing:
+            return values  # type: ignore[return-value]
+        
+        if len(cache) + len(missing) > self.max_size:
+            cache.clear()
+        # float() turns NumPy scalars from vectorized heuristics into floats
+        computed = {state: float(value) for state, value
+                    in zip(missing, self.inner.h_batch(missing))}
+        cache.update(computed)
+        return [computed[state] if value is None else value
+                for state, value in zip(states, values)]
+    
+    def is_admissible(self) -> bool:
+        """Delegate to the wrapped heuristic."""
+        return self.inner.is_admissible()
+    
+    def is_consistent(self) -> bool:
+        """Delegate to the wrapped heuristic."""
+        return self.inner.is_consistent()
+
+
+class _PathField:
+    """
+    Descriptor behind SearchResult.path and SearchResult.actions.
+    
+    It is the field's default, so the dataclass __init__ still accepts
+    path= and actions= and repr(), asdict() and == still see them. A
+    value passed in is kept as is; a field left at None is reconstructed
+    from goal_node on first read by SearchResult._reconstruct_<name>(),
+    then cached.
+    """
+    
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        self.slot = '_' + name
+    
+    @overload
+    def __get__(self, obj: None, owner: Any = None) -> None: ...
+    
+    @overload
+    def __get__(self, obj: 'SearchResult[Any]', owner: Any = None) -> List[Any]: ...
+    
+    def __get__(self, obj: Optional['SearchResult[Any]'], owner: Any = None) -> Optional[List[Any]]:
+        # Read on the class by @dataclass: the field's default
+        if obj is None:
+            return None
+        value = obj.__dict__.get(self.slot)
+        if value is None:
+            value = getattr(obj, '_reconstruct_' + self.name)()
+            obj.__dict__[self.slot] = value
+        return value
+    
+    def __set__(self, obj: 'SearchResult[Any]', value: Optional[List[Any]]) -> None:
+        obj.__dict__[self.slot] = value
+
+
 @dataclass
 class SearchResult(Generic[StateType]):
     """
     Result object returned by the search engine.
     
+    The engine leaves path and actions unset: they are reconstructed from
+    goal_node's parent links the first time they are read, then cached,
+    so callers that only look at total_cost or the statistics never pay
+    for them. Lists passed to the constructor are used as given.
+    
     Attributes:
         success: Whether a goal state was found
         goal_node: The goal node if found, None otherwise
@@ -270,14 +551,74 @@ class SearchResult(Generic[StateType]):
     nodes_expanded: int = 0
     nodes_generated: int = 0
     max_frontier_size: int = 0
-    path: List[StateType] = None
-    actions: List[Any] = None
+    path: _PathField = _PathField()
+    actions: _PathField = _PathField()
     total_cost: float = float('inf')
     
-    def __post_init__(self):
-        """Initialize empty lists for path and actions if None."""
-        if self.path is None:
-            self.path = []
-        if self.actions is None:
-            self.actions = []
-
+    def _reconstruct_path(self) -> List[StateType]:
+        """
+        Return the states from the initial state to goal_node.
+        
+        The goal depth gives the path length up front, so the list is
+        pre-sized and filled back to front. Chains whose depths don't match
+        their length (e.g. nodes built by hand with the default depth) are
+        walked and reversed instead.
+        """
+        if self.goal_node is None:
+            return []
+        i = self.goal_node.depth
+        path: List[Any] = [None] * (i + 1)
+        current: Optional[Node[StateType]] = self.goal_node
+        while current is not None and i >= 0:
+            path[i] = current.state
+            current = current.parent
+            i -= 1
+        
+        if current is not None or i != -1:
+            return [node.state for node in self._node_chain()]
+        return path
+    
+    def _reconstruct_actions(self) -> List[Any]:
+        """
+        Return the actions leading to goal_node, leaving out None ones.
+        
+        Pre-sized from the goal depth like the path, with the same fallback.
+        """
+        if self.goal_node is None:
+            return []
+        i = self.goal_node.depth
+        actions: List[Any] = [None] * i
+        has_none_action = False
+        current: Optional[Node[StateType]] = self.goal_node
+        while current is not None and i > 0:
+            action = current.action
+            if action is None:
+                has_none_action = True
+            actions[i - 1] = action
+            current = current.parent
+            i -= 1
+        
+        # current must now be the root
+        if current is None or current.parent is not None:
+            return [node.action for node in self._node_chain() if node.action is not None]
+        if current.action is not None:
+            actions.insert(0, current.action)
+        
+        # Actions that are None are not part of the action list
+        if has_none_action:
+            actions = [action for action in actions if action is not None]
+        return actions
+    
+    def _node_chain(self) -> List[Node[StateType]]:
+        """Return the nodes from the root to goal_node by following parent links."""
+        chain: List[Node[StateType]] = []
+        current = self.goal_node
+        
+        # Trace back to root
+        while current is not None:
+            chain.append(current)
+            current = current.parent
+        
+        # Reverse to get initial -> goal order
+        chain.reverse()
+        return chain
@@ -3,11 +3,15 @@ Data structures module for frontier implementations.
 """
 
 from .priority_queue import PriorityQueueFrontier
+from .indexed_priority_queue import IndexedPriorityQueueFrontier
+from .bucket_queue import BucketQueueFrontier
 from .fifo_queue import FIFOQueueFrontier
 from .lifo_stack import LIFOStackFrontier
 
 __all__ = [
     'PriorityQueueFrontier',
+    'IndexedPriorityQueueFrontier',
+    'BucketQueueFrontier',
     'FIFOQueueFrontier',
     'LIFOStackFrontier'
 ]
@@ -0,0 +1,241 @@
+"""
+Bucket queue (Dial's algorithm) for searches with small integer priorities.
+
+Used by: Uniform Cost Search, A*, BFS when every priority is an integer in
+[0, max_priority], e.g. unit-cost grids and puzzles with integer heuristics
+"""
+
+from collections import deque
+from typing import Deque, Dict, List, Tuple
+from src.core.types import AbstractFrontier, Node, StateType
+
+
+class BucketQueueFrontier(AbstractFrontier[StateType]):
+    """
+    Array of FIFO buckets indexed by integer priority.
+    
+    Push appends to the bucket of its priority and pop takes from the
+    lowest non-empty bucket, found by advancing a head pointer, so both are
+    O(1) amortized instead of a heap's O(log n). Nodes with equal priority
+    come out in insertion order, which is the order PriorityQueueFrontier
+    breaks ties in, so the two frontiers expand the same nodes.
+    
+    Like PriorityQueueFrontier, it keeps one live entry per state: pushing
+    a state again with a lower priority lazily deletes the old entry.
+    
+    Attributes:
+        max_priority: Largest priority accepted by push()
+        buckets: One deque of (priority, node) entries per priority value
+        entry_finder: Dict mapping states to their live entry (the same
+            tuple object); bucket entries it does not point to are stale
+        head: Lowest bucket that may be non-empty
+    """
+    
+    unique_states = True
+    
+    def __init__(self, max_priority: int):
+        """
+        Initialize an empty bucket queue.
+        
+        Args:
+            max_priority: Largest priority that will be pushed, e.g. an upper
+                bound on the solution cost for UCS or on f(n) for A*
+        
+        Raises:
+            ValueError: If max_priority is negative
+        """
+        if max_priority < 0:
+            raise ValueError(f"max_priority must be non-negative, got {max_priority}")
+        
+        self.max_priority = max_priority
+        self.buckets: List[Deque[Tuple[int, Node[StateType]]]] = [
+            deque() for _ in range(max_priority + 1)
+        ]
+        self.entry_finder: Dict[StateType, Tuple[int, Node[StateType]]] = {}
+        self.head = 0
+    
+    def _bucket_index(self, priority: float) -> int:
+        """
+        Map a priority to its bucket.
+        
+        Args:
+            priority: The priority value
+        
+        Returns:
+            The priority as an int
+        
+        Raises:
+            ValueError: If priority is not an integer in [0, max_priority]
+        """
+        if not 0 <= priority <= self.max_priority or priority != int(priority):
+            raise ValueError(
+                f"BucketQueueFrontier priorities must be integers in "
+                f"[0, {self.max_priority}], got {priority}"
+            )
+        return int(priority)
+    
+    def push(self, node: Node[StateType], priority: float) -> None:
+        """
+        Insert a node with given priority, or update if better priority exists.
+        
+        Args:
+            node: The node to insert
+            priority: The priority value (lower = higher priority)
+        
+        Raises:
+            ValueError: If priority is not an integer in [0, max_priority]
+        """
+        bucket = self._bucket_index(priority)
+        
+        # Keep existing entry with better (lower or equal) priority
+        old_entry = self.entry_finder.get(node.state)
+        if old_entry is not None and bucket >= old_entry[0]:
+            return
+        
+        # Replacing the entry lazily deletes the old one
+        entry = (bucket, node)
+        self.entry_finder[node.state] = entry
+        self.buckets[bucket].append(entry)
+        # Priorities below the head only appear with inconsistent heuristics
+        if bucket < self.head:
+            self.head = bucket
+    
+    push_or_decrease = push
+    
+    def push_many(self, items: List[Tuple[Node[StateType], float]]) -> None:
+        """
+        Insert several nodes, same as calling push() on each.
+        
+        Args:
+            items: (node, priority) pairs, in generation order
+        
+        Raises:
+            ValueError: If a priority is not an integer in [0, max_priority]
+        """
+        entry_finder = self.entry_finder
+        buckets = self.buckets
+        bucket_index = self._bucket_index
+        head = self.head
+        
+        for node, priority in items:
+            bucket = bucket_index(priority)
+            state = node.state
+            old_entry = entry_finder.get(state)
+            # Keep existing entry with better priority
+            if old_entry is not None and bucket >= old_entry[0]:
+                continue
+            entry = (bucket, node)
+            entry_finder[state] = entry
+            buckets[bucket].append(entry)
+            if bucket < head:
+                head = bucket
+        
+        self.head = head
+    
+    def pop(self) -> Node[StateType]:
+        """
+        Remove and return the node with lowest priority.
+        
+        Returns:
+            The node with highest priority (lowest value), oldest first
+        
+        Raises:
+            IndexError: If the frontier is empty
+        """
+        entry_finder = self.entry_finder
+        buckets = self.buckets
+        head = self.head
+        
+        # Skip empty buckets and lazily deleted entries
+        while entry_finder:
+            bucket = buckets[head]
+            if not bucket:
+                head += 1
+                continue
+            
+            entry = bucket.popleft()
+            node = entry[1]
+            if entry_finder.get(node.state) is entry:
+                del entry_finder[node.state]
+                self.head = head
+                return node
+        
+        raise IndexError("pop from empty bucket queue")
+    
+    def peek_min_priority(self) -> float:
+        """
+        Return the lowest priority in the frontier without removing its node.
+        
+        Empty buckets and stale entries at the head are discarded on the way.
+        
+        Returns:
+            The priority of the node pop() would return
+        
+        Raises:
+            IndexError: If the frontier is empty
+        """
+        entry_finder = self.entry_finder
+        buckets = self.buckets
+        head = self.head
+        
+        while entry_finder:
+            bucket = buckets[head]
+            if not bucket:
+                head += 1
+                continue
+            
+            entry = bucket[0]
+            if entry_finder.get(entry[1].state) is entry:
+                self.head = head
+                return float(head)
+            bucket.popleft()
+        
+        raise IndexError("peek from empty bucket queue")
+    
+    def remove_state(self, state: StateType) -> Node[StateType]:
+        """
+        Remove the node of a state from the frontier.
+        
+        The bucket entry is lazily deleted: once entry_finder no longer
+        points at it, pop() skips it.
+        
+        Args:
+            state: The state to remove
+        
+        Returns:
+            The removed node
+        
+        Raises:
+            KeyError: If no node with this state is in the frontier
+        """
+        return self.entry_finder.pop(state)[1]
+    
+    def is_empty(self) -> bool:
+        """
+        Check if the frontier is empty.
+        
+        Returns:
+            True if no valid nodes remain
+        """
+        return len(self.entry_finder) == 0
+    
+    def __len__(self) -> int:
+        """
+        Return the number of nodes in the frontier.
+        
+        Returns:
+            Count of valid nodes (excluding lazily deleted entries)
+        """
+        return len(self.entry_finder)
+    
+    def __contains__(self, node: Node[StateType]) -> bool:
+        """
+        Check if a node's state is in the frontier.
+        
+        Args:
+            node: The node to check
+        
+        Returns:
+            True if a node with this state exists in frontier
+        """
+        return node.state in self.entry_finder
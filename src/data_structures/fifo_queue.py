@@ -4,8 +4,8 @@ FIFO Queue implementation for Breadth-First Search.
 Used by: BFS (uninformed search)
 """
 
-from collections import deque
-from typing import Set
+from collections import OrderedDict
+from typing import List, Tuple
 from src.core.types import AbstractFrontier, Node, StateType
 
 
@@ -17,14 +17,16 @@ class FIFOQueueFrontier(AbstractFrontier[StateType]):
     they were discovered (shallowest nodes first).
     
     Attributes:
-        queue: Deque for efficient O(1) operations at both ends
-        state_set: Set of states for O(1) membership testing
+        queue: OrderedDict mapping states to nodes in insertion order. One
+            structure serves both ordering and O(1) membership testing, so
+            each push or pop hashes the state once.
     """
     
+    unique_states = True
+    
     def __init__(self):
         """Initialize an empty FIFO queue."""
-        self.queue: deque[Node[StateType]] = deque()
-        self.state_set: Set[StateType] = set()
+        self.queue: OrderedDict[StateType, Node[StateType]] = OrderedDict()
     
     def push(self, node: Node[StateType], priority: float) -> None:
         """
@@ -36,9 +38,22 @@ class FIFOQueueFrontier(AbstractFrontier[StateType]):
             node: The node to insert
             priority: Ignored (FIFO doesn't use priorities)
         """
-        if node.state not in self.state_set:
-            self.queue.append(node)
-            self.state_set.add(node.state)
+        # A state already in the queue keeps its earlier position
+        self.queue.setdefault(node.state, node)
+    
+    # No priorities to decrease: relaxing a successor is a plain push
+    push_or_decrease = push
+    
+    def push_many(self, items: List[Tuple[Node[StateType], float]]) -> None:
+        """
+        Add several nodes to the back of the queue, in order.
+        
+        Args:
+            items: (node, priority) pairs; priorities are ignored
+        """
+        setdefault = self.queue.setdefault
+        for node, _ in items:
+            setdefault(node.state, node)
     
     def pop(self) -> Node[StateType]:
         """
@@ -53,10 +68,25 @@ class FIFOQueueFrontier(AbstractFrontier[StateType]):
         if not self.queue:
             raise IndexError("pop from empty FIFO queue")
         
-        node = self.queue.popleft()
-        self.state_set.discard(node.state)
+        # popitem(last=False) removes the oldest entry in O(1)
+        _, node = self.queue.popitem(last=False)
         return node
     
+    def remove_state(self, state: StateType) -> Node[StateType]:
+        """
+        Remove the node of a state from the queue, wherever it is.
+        
+        Args:
+            state: The state to remove
+        
+        Returns:
+            The removed node
+        
+        Raises:
+            KeyError: If no node with this state is in the queue
+        """
+        return self.queue.pop(state)
+    
     def is_empty(self) -> bool:
         """
         Check if the queue is empty.
@@ -85,5 +115,5 @@ class FIFOQueueFrontier(AbstractFrontier[StateType]):
         Returns:
             True if a node with this state exists in queue
         """
-        return node.state in self.state_set
+        return node.state in self.queue
 
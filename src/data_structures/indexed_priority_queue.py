@@ -0,0 +1,195 @@
+"""
+Indexed Priority Queue implementation with decrease-key support.
+
+Used by: Uniform Cost Search, A*, and graph search with allow_revisit=True
+"""
+
+from heapq import heappush, heappop, heapify
+from typing import Any, List, Dict, Tuple
+from src.core.types import AbstractFrontier, Node, StateType
+
+
+# Positions inside a heap entry [priority, counter, node, valid]
+_PRIORITY = 0
+_NODE = 2
+_VALID = 3
+
+
+class IndexedPriorityQueueFrontier(AbstractFrontier[StateType]):
+    """
+    Min-heap priority queue indexed by state, exposing decrease-key.
+    
+    Each state has at most one live entry. Entries are mutable lists shared
+    between the heap and the index, so decreasing a key only flips the valid
+    flag of the old entry instead of searching the heap for it. Invalid
+    entries are skipped when they reach the top of the heap.
+    
+    Attributes:
+        heap: Min-heap of [priority, counter, node, valid] entries
+        entries: Dict mapping states to their live heap entry
+        counter: Tie-breaker for nodes with equal priority (FIFO order)
+    """
+    
+    unique_states = True
+    
+    def __init__(self):
+        """Initialize an empty indexed priority queue."""
+        self.heap: List[List[Any]] = []
+        self.entries: Dict[StateType, List[Any]] = {}
+        self.counter = 0  # Tie-breaker for stable sorting
+    
+    def push_or_decrease(self, node: Node[StateType], priority: float) -> None:
+        """
+        Insert a node, or decrease the key of its state if already queued.
+        
+        If the state is already in the frontier with an equal or better
+        priority, the call is a no-op.
+        
+        Args:
+            node: The node to insert
+            priority: The priority value (lower = higher priority)
+        """
+        entries = self.entries
+        state = node.state
+        old_entry = entries.get(state)
+        
+        if old_entry is not None:
+            if priority >= old_entry[_PRIORITY]:
+                return
+            # Decrease-key: invalidate the old entry in place
+            old_entry[_VALID] = False
+        
+        entry = [priority, self.counter, node, True]
+        entries[state] = entry
+        heappush(self.heap, entry)
+        self.counter += 1
+    
+    # A plain push has the same semantics: one live entry per state
+    push = push_or_decrease
+    
+    def push_many(self, items: List[Tuple[Node[StateType], float]]) -> None:
+        """
+        Insert or decrease-key several nodes, same as push_or_decrease().
+        
+        New entries are added with extend() and one heapify when the batch
+        is at least as large as the heap, and heappush()ed otherwise (see
+        PriorityQueueFrontier.push_many).
+        
+        Args:
+            items: (node, priority) pairs, in generation order
+        """
+        entries = self.entries
+        counter = self.counter
+        new_entries = []
+        
+        for node, priority in items:
+            state = node.state
+            old_entry = entries.get(state)
+            if old_entry is not None:
+                if priority >= old_entry[_PRIORITY]:
+                    continue
+                old_entry[_VALID] = False
+            
+            entry = [priority, counter, node, True]
+            entries[state] = entry
+            new_entries.append(entry)
+            counter += 1
+        
+        self.counter = counter
+        heap = self.heap
+        if len(new_entries) >= len(heap):
+            heap.extend(new_entries)
+            heapify(heap)
+        else:
+            for entry in new_entries:
+                heappush(heap, entry)
+    
+    def pop(self) -> Node[StateType]:
+        """
+        Remove and return the node with lowest priority.
+        
+        Returns:
+            The node with highest priority (lowest value)
+        
+        Raises:
+            IndexError: If the frontier is empty
+        """
+        heap = self.heap
+        while heap:
+            entry = heappop(heap)
+            if entry[_VALID]:
+                node = entry[_NODE]
+                del self.entries[node.state]
+                return node
+        
+        raise IndexError("pop from empty indexed priority queue")
+    
+    def peek_min_priority(self) -> float:
+        """
+        Return the lowest priority in the frontier without removing its node.
+        
+        Invalid entries on top of the heap are discarded on the way.
+        
+        Returns:
+            The priority of the node pop() would return
+        
+        Raises:
+            IndexError: If the frontier is empty
+        """
+        heap = self.heap
+        while heap:
+            entry = heap[0]
+            if entry[_VALID]:
+                return entry[_PRIORITY]
+            heappop(heap)
+        
+        raise IndexError("peek from empty indexed priority queue")
+    
+    def remove_state(self, state: StateType) -> Node[StateType]:
+        """
+        Remove the node of a state from the frontier.
+        
+        Like decrease-key, this only invalidates the heap entry in place.
+        
+        Args:
+            state: The state to remove
+        
+        Returns:
+            The removed node
+        
+        Raises:
+            KeyError: If no node with this state is in the frontier
+        """
+        entry = self.entries.pop(state)
+        entry[_VALID] = False
+        return entry[_NODE]
+    
+    def is_empty(self) -> bool:
+        """
+        Check if the frontier is empty.
+        
+        Returns:
+            True if no valid nodes remain
+        """
+        return len(self.entries) == 0
+    
+    def __len__(self) -> int:
+        """
+        Return the number of nodes in the frontier.
+        
+        Returns:
+            Count of valid nodes (excluding invalidated entries)
+        """
+        return len(self.entries)
+    
+    def __contains__(self, node: Node[StateType]) -> bool:
+        """
+        Check if a node's state is in the frontier.
+        
+        Args:
+            node: The node to check
+        
+        Returns:
+            True if a node with this state exists in frontier
+        """
+        return node.state in self.entries
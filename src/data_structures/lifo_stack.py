@@ -4,7 +4,7 @@ LIFO Stack implementation for Depth-First Search.
 Used by: DFS (uninformed search)
 """
 
-from typing import List, Set
+from typing import Dict, List, Tuple
 from src.core.types import AbstractFrontier, Node, StateType
 
 
@@ -16,14 +16,17 @@ class LIFOStackFrontier(AbstractFrontier[StateType]):
     recently discovered nodes first (deepest-first exploration).
     
     Attributes:
-        stack: List used as a stack for O(1) push/pop at end
-        state_set: Set of states for O(1) membership testing
+        stack: Dict mapping states to nodes in insertion order, used as a
+            stack: popitem() removes the most recent entry in O(1). One
+            structure serves both ordering and membership testing, so each
+            push or pop hashes the state once.
     """
     
+    unique_states = True
+    
     def __init__(self):
         """Initialize an empty LIFO stack."""
-        self.stack: List[Node[StateType]] = []
-        self.state_set: Set[StateType] = set()
+        self.stack: Dict[StateType, Node[StateType]] = {}
     
     def push(self, node: Node[StateType], priority: float) -> None:
         """
@@ -35,9 +38,22 @@ class LIFOStackFrontier(AbstractFrontier[StateType]):
             node: The node to insert
             priority: Ignored (LIFO doesn't use priorities)
         """
-        if node.state not in self.state_set:
-            self.stack.append(node)
-            self.state_set.add(node.state)
+        # A state already on the stack keeps its earlier position
+        self.stack.setdefault(node.state, node)
+    
+    # No priorities to decrease: relaxing a successor is a plain push
+    push_or_decrease = push
+    
+    def push_many(self, items: List[Tuple[Node[StateType], float]]) -> None:
+        """
+        Push several nodes onto the stack, in order.
+        
+        Args:
+            items: (node, priority) pairs; priorities are ignored
+        """
+        setdefault = self.stack.setdefault
+        for node, _ in items:
+            setdefault(node.state, node)
     
     def pop(self) -> Node[StateType]:
         """
@@ -52,10 +68,24 @@ class LIFOStackFrontier(AbstractFrontier[StateType]):
         if not self.stack:
             raise IndexError("pop from empty LIFO stack")
         
-        node = self.stack.pop()
-        self.state_set.discard(node.state)
+        _, node = self.stack.popitem()
         return node
     
+    def remove_state(self, state: StateType) -> Node[StateType]:
+        """
+        Remove the node of a state from the stack, wherever it is.
+        
+        Args:
+            state: The state to remove
+        
+        Returns:
+            The removed node
+        
+        Raises:
+            KeyError: If no node with this state is in the stack
+        """
+        return self.stack.pop(state)
+    
     def is_empty(self) -> bool:
         """
         Check if the stack is empty.
@@ -84,5 +114,5 @@ class LIFOStackFrontier(AbstractFrontier[StateType]):
         Returns:
             True if a node with this state exists in stack
         """
-        return node.state in self.state_set
+        return node.state in self.stack
 
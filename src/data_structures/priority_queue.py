@@ -4,7 +4,9 @@ Priority Queue implementation for informed search strategies.
 Used by: Uniform Cost Search, A*, Greedy Best-First Search
 """
 
-import heapq
+# heapq's functions are implemented in C (_heapq); binding them at module
+# level saves an attribute lookup per heap operation
+from heapq import heappush, heappop, heapify
 from typing import List, Tuple, Dict
 from src.core.types import AbstractFrontier, Node, StateType
 
@@ -21,10 +23,14 @@ class PriorityQueueFrontier(AbstractFrontier[StateType]):
     
     Attributes:
         heap: Min-heap of (priority, counter, node) tuples
-        entry_finder: Dict mapping states to heap entries for fast lookup
+        entry_finder: Dict mapping states to their live heap entry (the same
+            tuple object); heap entries it does not point to are stale
         counter: Tie-breaker for nodes with equal priority (FIFO order)
     """
     
+    # At most one entry per state: lazily deleted entries are never returned
+    unique_states = True
+    
     def __init__(self):
         """Initialize an empty priority queue."""
         self.heap: List[Tuple[float, int, Node[StateType]]] = []
@@ -40,22 +46,59 @@ class PriorityQueueFrontier(AbstractFrontier[StateType]):
             priority: The priority value (lower = higher priority)
         """
         # Check if state already in frontier
-        if node.state in self.entry_finder:
-            # Get existing entry
-            old_priority, _, _ = self.entry_finder[node.state]
-            # Only update if new priority is better (lower)
-            if priority < old_priority:
-                # Remove old entry (lazy deletion - mark as invalid)
-                del self.entry_finder[node.state]
-            else:
-                # Keep existing entry with better priority
-                return
-        
-        # Add new entry
-        entry = (priority, self.counter, node)
+        old_entry = self.entry_finder.get(node.state)
+        # Keep existing entry with better (lower or equal) priority
+        if old_entry is not None and priority >= old_entry[0]:
+            return
+        
+        # Add new entry; replacing it in entry_finder lazily deletes the old one.
+        # The heap and entry_finder share one tuple, so a push allocates one.
+        counter = self.counter
+        entry = (priority, counter, node)
         self.entry_finder[node.state] = entry
-        heapq.heappush(self.heap, entry)
-        self.counter += 1
+        heappush(self.heap, entry)
+        self.counter = counter + 1
+    
+    # push already keeps only the better of two entries for a state
+    push_or_decrease = push
+    
+    def push_many(self, items: List[Tuple[Node[StateType], float]]) -> None:
+        """
+        Insert several nodes, same as calling push() on each.
+        
+        A heapify costs O(len(heap)), so the new entries are added with
+        extend() and one heapify only when the batch is at least as large as
+        the heap (early in the search); otherwise they are heappush()ed.
+        Entries are totally ordered by (priority, counter), so pop order is
+        the same either way.
+        
+        Args:
+            items: (node, priority) pairs, in generation order
+        """
+        entry_finder = self.entry_finder
+        counter = self.counter
+        entries = []
+        
+        for node, priority in items:
+            state = node.state
+            old_entry = entry_finder.get(state)
+            # Keep existing entry with better priority
+            if old_entry is not None and priority >= old_entry[0]:
+                continue
+            # Replacing the entry lazily deletes the old one
+            entry = (priority, counter, node)
+            entry_finder[state] = entry
+            entries.append(entry)
+            counter += 1
+        
+        self.counter = counter
+        heap = self.heap
+        if len(entries) >= len(heap):
+            heap.extend(entries)
+            heapify(heap)
+        else:
+            for entry in entries:
+                heappush(heap, entry)
     
     def pop(self) -> Node[StateType]:
         """
@@ -67,20 +110,62 @@ class PriorityQueueFrontier(AbstractFrontier[StateType]):
         Raises:
             IndexError: If the frontier is empty
         """
+        heap = self.heap
+        entry_finder = self.entry_finder
+        
         # Pop until we find a valid entry (not lazily deleted)
-        while self.heap:
-            priority, count, node = heapq.heappop(self.heap)
+        while heap:
+            entry = heappop(heap)
+            node = entry[2]
             
-            # Check if this is the current entry for this state
-            if node.state in self.entry_finder:
-                current_entry = self.entry_finder[node.state]
-                # Verify this is the same entry (not outdated)
-                if current_entry == (priority, count, node):
-                    del self.entry_finder[node.state]
-                    return node
+            # Live only if entry_finder still points at this very tuple;
+            # an identity check, no tuple or Node.__eq__ comparison
+            if entry_finder.get(node.state) is entry:
+                del entry_finder[node.state]
+                return node
         
         raise IndexError("pop from empty priority queue")
     
+    def peek_min_priority(self) -> float:
+        """
+        Return the lowest priority in the frontier without removing its node.
+        
+        Stale entries on top of the heap are discarded on the way.
+        
+        Returns:
+            The priority of the node pop() would return
+        
+        Raises:
+            IndexError: If the frontier is empty
+        """
+        heap = self.heap
+        entry_finder = self.entry_finder
+        while heap:
+            entry = heap[0]
+            if entry_finder.get(entry[2].state) is entry:
+                return entry[0]
+            heappop(heap)
+        
+        raise IndexError("peek from empty priority queue")
+    
+    def remove_state(self, state: StateType) -> Node[StateType]:
+        """
+        Remove the node of a state from the frontier.
+        
+        The heap entry is lazily deleted: once entry_finder no longer points
+        at it, pop() skips it.
+        
+        Args:
+            state: The state to remove
+        
+        Returns:
+            The removed node
+        
+        Raises:
+            KeyError: If no node with this state is in the frontier
+        """
+        return self.entry_finder.pop(state)[2]
+    
     def is_empty(self) -> bool:
         """
         Check if the frontier is empty.
@@ -5,7 +5,8 @@ A* combines actual cost g(n) with heuristic estimate h(n).
 Guarantees optimal solutions when heuristic is admissible.
 """
 
-from src.core.types import Node, AbstractHeuristic, StateType
+from src.core.types import Node, AbstractHeuristic, StateType, STRATEGY_ASTAR
+from src.strategies.uninformed.ucs import uniform_cost_priority
 
 
 def astar_priority(node: Node[StateType], heuristic: AbstractHeuristic[StateType]) -> float:
@@ -33,3 +34,8 @@ def astar_priority(node: Node[StateType], heuristic: AbstractHeuristic[StateType
     f_n = g_n + h_n
     return f_n
 
+
+astar_priority.strategy_flag = STRATEGY_ASTAR  # type: ignore[attr-defined]
+
+# With a NullHeuristic f(n) = g(n), so the engine can skip the h(n) call
+astar_priority.null_heuristic_variant = uniform_cost_priority  # type: ignore[attr-defined]
@@ -5,7 +5,7 @@ Greedy Search expands nodes that appear closest to the goal based solely on h(n)
 Does not guarantee optimal solutions but can be very fast.
 """
 
-from src.core.types import Node, AbstractHeuristic, StateType
+from src.core.types import Node, AbstractHeuristic, StateType, STRATEGY_GREEDY
 
 
 def greedy_best_first_priority(node: Node[StateType], heuristic: AbstractHeuristic[StateType]) -> float:
@@ -27,3 +27,22 @@ def greedy_best_first_priority(node: Node[StateType], heuristic: AbstractHeurist
     """
     return heuristic.h(node.state)
 
+
+def _null_heuristic_greedy_priority(node: Node[StateType], heuristic: AbstractHeuristic[StateType]) -> float:
+    """
+    Greedy Best-First priority under a NullHeuristic, where h(n) = 0.
+    
+    Args:
+        node: The node to compute priority for
+        heuristic: Ignored (always a NullHeuristic)
+        
+    Returns:
+        0.0, what greedy_best_first_priority returns for every node
+    """
+    return 0.0
+
+
+greedy_best_first_priority.strategy_flag = STRATEGY_GREEDY  # type: ignore[attr-defined]
+
+# With a NullHeuristic h(n) = 0, so the engine can skip the h(n) call
+greedy_best_first_priority.null_heuristic_variant = _null_heuristic_greedy_priority  # type: ignore[attr-defined]
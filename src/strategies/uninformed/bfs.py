@@ -5,7 +5,7 @@ BFS expands nodes in order of depth (shallowest first).
 Optimal for problems with uniform edge costs.
 """
 
-from src.core.types import Node, AbstractHeuristic, StateType
+from src.core.types import Node, AbstractHeuristic, StateType, STRATEGY_BFS
 
 
 def breadth_first_priority(node: Node[StateType], heuristic: AbstractHeuristic[StateType]) -> float:
@@ -26,3 +26,5 @@ def breadth_first_priority(node: Node[StateType], heuristic: AbstractHeuristic[S
     """
     return float(node.depth)
 
+
+breadth_first_priority.strategy_flag = STRATEGY_BFS  # type: ignore[attr-defined]
@@ -5,7 +5,7 @@ DFS expands nodes in order of depth (deepest first).
 Explores as deep as possible before backtracking.
 """
 
-from src.core.types import Node, AbstractHeuristic, StateType
+from src.core.types import Node, AbstractHeuristic, StateType, STRATEGY_DFS
 
 
 def depth_first_priority(node: Node[StateType], heuristic: AbstractHeuristic[StateType]) -> float:
@@ -26,3 +26,5 @@ def depth_first_priority(node: Node[StateType], heuristic: AbstractHeuristic[Sta
     """
     return -float(node.depth)
 
+
+depth_first_priority.strategy_flag = STRATEGY_DFS  # type: ignore[attr-defined]
@@ -5,7 +5,7 @@ UCS expands nodes in order of path cost g(n) from the initial state.
 Guarantees optimal solutions for problems with non-negative edge costs.
 """
 
-from src.core.types import Node, AbstractHeuristic, StateType
+from src.core.types import Node, AbstractHeuristic, StateType, STRATEGY_UCS
 
 
 def uniform_cost_priority(node: Node[StateType], heuristic: AbstractHeuristic[StateType]) -> float:
@@ -26,3 +26,5 @@ def uniform_cost_priority(node: Node[StateType], heuristic: AbstractHeuristic[St
     """
     return node.path_cost
 
+
+uniform_cost_priority.strategy_flag = STRATEGY_UCS  # type: ignore[attr-defined]